@@ -0,0 +1,87 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Optional compiled helpers for the construction and makespan evaluation.
+
+Used by heuristics.randomized_constructive_heuristic and
+makespan.calculate_makespan when Numba is not installed. Build it in place
+(ahead of time, so there is no per-run compile cost) with:
+
+    cythonize -i _construct.pyx
+
+If the extension is missing, the NumPy / pure-Python implementations are
+used instead.
+"""
+
+import numpy as np
+from libc.math cimport exp, INFINITY
+
+
+def compute_probs(const double[::1] totals, const unsigned char[::1] mask, double alpha):
+    """
+    Selection probabilities of the unscheduled jobs, in ascending job order.
+
+    Same normalized exponential bias as the NumPy alpha branch: totals are
+    rescaled to [0, 1] over the unscheduled jobs (0.5 when they are all equal),
+    weighted by exp(-alpha * s) and normalized to sum to one.
+    """
+    cdef Py_ssize_t n = totals.shape[0]
+    cdef Py_ssize_t j, c = 0
+    cdef double lo = INFINITY, hi = -INFINITY, t, spread, s, acc = 0.0
+
+    for j in range(n):
+        if mask[j]:
+            t = totals[j]
+            if t < lo:
+                lo = t
+            if t > hi:
+                hi = t
+            c += 1
+
+    probs_arr = np.empty(c)
+    cdef double[::1] probs = probs_arr
+    spread = hi - lo
+    c = 0
+    for j in range(n):
+        if mask[j]:
+            s = (totals[j] - lo) / spread if spread > 0 else 0.5
+            probs[c] = exp(-alpha * s)
+            acc += probs[c]
+            c += 1
+    for j in range(c):
+        probs[j] /= acc
+    return probs_arr
+
+
+ctypedef fused real_t:
+    float
+    double
+
+ctypedef fused index_t:
+    int
+    long
+    long long
+
+
+def makespan(const real_t[:, ::1] P, const index_t[::1] sequence):
+    """
+    Makespan of sequence over the C-contiguous matrix P.
+
+    Same rolling-row recurrence (and float64 accumulation) as
+    makespan._makespan_kernel; the caller validates the job indices.
+    """
+    cdef Py_ssize_t m = P.shape[1]
+    cdef Py_ssize_t i, k, job
+    cdef double up, left
+
+    if m == 0:
+        return 0.0
+    row_arr = np.zeros(m)
+    cdef double[::1] row = row_arr
+    for i in range(sequence.shape[0]):
+        job = sequence[i]
+        left = 0.0
+        for k in range(m):
+            up = row[k]
+            left = (up if up > left else left) + P[job, k]
+            row[k] = left
+    return row[m - 1]
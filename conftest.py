@@ -0,0 +1,65 @@
+"""
+Shared instances and reference helpers for the test modules.
+
+The reference recurrence is the textbook double loop; every makespan,
+completion-time and pricing routine is checked against it on integer and
+fractional instances.
+"""
+
+import numpy as np
+import pytest
+
+import makespan
+
+# (num_jobs, num_machines): tiny (list path), degenerate, and wide enough for
+# the machine-tiled kernel (more than 2 * _MACHINE_TILE machines)
+SHAPES = [(5, 3), (1, 4), (6, 1), (20, 7), (12, 40)]
+
+
+def make_instance(num_jobs, num_machines, fractional, seed=0):
+    rng = np.random.default_rng(seed)
+    if fractional:
+        return np.round(rng.uniform(1.0, 99.0, (num_jobs, num_machines)), 3)
+    return rng.integers(1, 100, (num_jobs, num_machines)).astype(np.float64)
+
+
+def reference_completion_times(P, sequence):
+    C = np.zeros((len(sequence), P.shape[1]))
+    for i, job in enumerate(sequence):
+        for k in range(P.shape[1]):
+            up = C[i - 1, k] if i > 0 else 0.0
+            left = C[i, k - 1] if k > 0 else 0.0
+            C[i, k] = max(up, left) + P[job, k]
+    return C
+
+
+def swapped(sequence, pos):
+    seq = list(sequence)
+    seq[pos], seq[pos + 1] = seq[pos + 1], seq[pos]
+    return seq
+
+
+def moved(sequence, from_pos, to_pos):
+    seq = list(sequence)
+    seq.insert(to_pos, seq.pop(from_pos))
+    return seq
+
+
+@pytest.fixture(params=[False, True], ids=['integer', 'fractional'])
+def fractional(request):
+    return request.param
+
+
+@pytest.fixture(params=SHAPES, ids=[f'{n}x{m}' for n, m in SHAPES])
+def instance(request, fractional):
+    num_jobs, num_machines = request.param
+    P = make_instance(num_jobs, num_machines, fractional)
+    sequence = np.random.default_rng(1).permutation(num_jobs).tolist()
+    return P, sequence
+
+
+@pytest.fixture
+def no_numba(monkeypatch):
+    # Route the dispatchers to their NumPy / list fallbacks
+    monkeypatch.setattr(makespan, 'NUMBA_AVAILABLE', False)
+    monkeypatch.setattr(makespan, '_makespan_c', None)
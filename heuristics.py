@@ -6,15 +6,40 @@ The Pendulum heuristic places jobs with smaller total processing times at the
 extremes and larger total times in the center, similar to a pendulum's weight distribution.
 """
 
-from typing import List, Optional, Union
-from makespan import calculate_makespan
-import random
+from typing import List, Optional, Tuple, Union
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 import numpy as np
 
+from jit_utils import njit, NUMBA_AVAILABLE
+
+# Optional Cython build of the alpha probability loop (see _construct.pyx),
+# used only when Numba is not available
+try:
+    from _construct import compute_probs as _compute_probs_c
+except ImportError:
+    _compute_probs_c = None
+
+__all__ = [
+    'PreparedInstance',
+    'calculate_total_processing_time',
+    'compute_job_totals',
+    'multi_start_construction',
+    'prepare_instance',
+    'pendulum_heuristic',
+    'randomized_constructive_heuristic',
+]
+
 
 def calculate_total_processing_time(processing_times: List[List[float]], job_idx: int) -> float:
     """
     Calculate the total processing time for a given job across all machines.
+
+    For more than a handful of jobs prefer compute_job_totals, which reduces
+    the whole matrix in one call.
     
     Args:
         processing_times: Matrix of processing times
@@ -23,10 +48,74 @@ def calculate_total_processing_time(processing_times: List[List[float]], job_idx
     Returns:
         Total processing time for the job
     """
-    return sum(processing_times[job_idx])
+    return float(np.sum(processing_times[job_idx]))
+
+
+def compute_job_totals(processing_times: np.ndarray) -> np.ndarray:
+    """
+    Total processing time of every job, computed once as a NumPy row sum.
+
+    The result can be passed to the heuristics and the local search through
+    their job_totals argument so the matrix is only reduced once per instance.
+    Float32 and integer matrices are accumulated in float64 directly, without
+    first making a float64 copy of the whole matrix.
+    """
+    return np.asarray(processing_times).sum(axis=1, dtype=np.float64)
 
 
-def pendulum_heuristic(processing_times: List[List[float]]) -> List[int]:
+@dataclass(frozen=True)
+class PreparedInstance:
+    """
+    A processing time matrix together with the per-job data the heuristics use.
+
+    Build it once with prepare_instance and pass it in place of the matrix;
+    repeated (multi-start) heuristic calls then skip the O(n*m) reductions.
+    total_processing (the sum of all times) is kept for reporting.
+    """
+    P: np.ndarray
+    totals: np.ndarray
+    m1: np.ndarray
+    total_processing: float = 0.0
+
+
+def prepare_instance(processing_times: np.ndarray) -> PreparedInstance:
+    """
+    Precompute job totals and first-machine times for processing_times.
+    
+    Args:
+        processing_times: Matrix of processing times
+        
+    Returns:
+        PreparedInstance accepted by pendulum_heuristic and
+        randomized_constructive_heuristic
+
+    Raises:
+        ValueError: If a non-empty processing_times is not 2-D
+    """
+    P = np.ascontiguousarray(processing_times)
+    if P.ndim != 2:
+        if P.size != 0:
+            raise ValueError("processing_times must be a 2-D jobs x machines matrix")
+        P = P.reshape(0, 0)
+    totals = compute_job_totals(P)
+    m1 = P[:, 0].astype(np.float64) if P.shape[1] > 0 else np.zeros(P.shape[0])
+    return PreparedInstance(P, totals, m1, float(totals.sum()))
+
+
+def _job_features(processing_times, job_totals) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (job totals, first-machine times) for a matrix or a PreparedInstance."""
+    if isinstance(processing_times, PreparedInstance):
+        return processing_times.totals, processing_times.m1
+    if len(processing_times) == 0:
+        return np.empty(0), np.empty(0)
+    P = np.asarray(processing_times)
+    totals = compute_job_totals(P) if job_totals is None else np.asarray(job_totals, dtype=np.float64)
+    m1 = P[:, 0].astype(np.float64) if P.shape[1] > 0 else np.zeros(P.shape[0])
+    return totals, m1
+
+
+def pendulum_heuristic(processing_times: Union[np.ndarray, PreparedInstance],
+                       job_totals: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Pendulum heuristic: place jobs with smaller total times at extremes,
     larger total times in the center (like a pendulum weight distribution).
@@ -38,129 +127,252 @@ def pendulum_heuristic(processing_times: List[List[float]]) -> List[int]:
     
     Args:
         processing_times: Matrix where processing_times[i][j] represents 
-                         processing time of job i on machine j
+                         processing time of job i on machine j, or a
+                         PreparedInstance built by prepare_instance
+        job_totals: Optional precomputed result of compute_job_totals
         
     Returns:
-        Sequence of job indices following the pendulum pattern
+        Sequence of job indices (int32 ndarray) following the pendulum pattern
     """
-    if not processing_times:
-        return []
-    
-    num_jobs = len(processing_times)
-    num_machines = len(processing_times[0]) if num_jobs > 0 else 0
-
-    # Precompute totals and machine-1 times for tie-breaking
-    totals = [calculate_total_processing_time(processing_times, i) for i in range(num_jobs)]
-    m1_times = [processing_times[i][0] if num_machines > 0 else 0 for i in range(num_jobs)]
+    # Totals (one vectorized row sum) and machine-1 times for tie-breaking
+    totals, m1_times = _job_features(processing_times, job_totals)
+    num_jobs = len(totals)
+    if num_jobs == 0:
+        return np.empty(0, dtype=np.int32)
 
-    # Step A: choose first job (min machine-1 time; tie-break by total, then job index)
-    first_job = min(range(num_jobs), key=lambda j: (m1_times[j], totals[j], j))
+    # Step A: choose first job (min machine-1 time; tie-break by total, then job index).
+    # np.lexsort treats its last key as the primary one.
+    job_ids = np.arange(num_jobs)
+    first_job = int(np.lexsort((job_ids, totals, m1_times))[0])
 
     # Step B: place the first job at position 0
-    sequence = [-1] * num_jobs
+    sequence = np.empty(num_jobs, dtype=np.int32)
     sequence[0] = first_job
 
     # Step C: sort remaining jobs by (total asc, machine1 asc, job index asc)
-    remaining = [j for j in range(num_jobs) if j != first_job]
-    remaining.sort(key=lambda j: (totals[j], m1_times[j], j))
-
-    # Step D: pendulum fill for the rest, starting from right then left and alternating
-    left = 1
-    right = num_jobs - 1
-    for k, job_idx in enumerate(remaining):
-        if k % 2 == 0:
-            # First remaining goes to the far right, then alternate
-            sequence[right] = job_idx
-            right -= 1
-        else:
-            sequence[left] = job_idx
-            left += 1
+    order = np.lexsort((job_ids, m1_times, totals))
+    remaining = order[order != first_job]
+
+    # Step D: pendulum fill for the rest, starting from right then left and alternating.
+    # Even-ranked jobs fill the right end inwards, odd-ranked ones follow the first job.
+    to_right = remaining[0::2]
+    to_left = remaining[1::2]
+    sequence[num_jobs - len(to_right):] = to_right[::-1]
+    sequence[1:1 + len(to_left)] = to_left
 
     return sequence
 
 
-def randomized_constructive_heuristic(processing_times: List[List[float]], 
+@njit(cache=True)
+def _alpha_construct_kernel(totals, first_machine, alpha, rng):
+    # Compiled mirror of the alpha branch below: same candidate order, the same
+    # normalized exponential bias and the same cumulative-probability draw as
+    # Generator.choice, so a given seed builds the same sequence.
+    n = totals.shape[0]
+    unscheduled = np.ones(n, dtype=np.bool_)
+    cand = np.empty(n, dtype=np.int64)
+    cdf = np.empty(n)
+    seq = np.empty(n, dtype=np.int32)
+
+    # The i-th placed job lands left of centre when i is odd, right otherwise
+    centre = n // 2
+    first = np.argmin(first_machine)
+    seq[centre] = first
+    unscheduled[first] = False
+
+    for i in range(1, n):
+        c = 0
+        lo = np.inf
+        hi = -np.inf
+        for j in range(n):
+            if unscheduled[j]:
+                cand[c] = j
+                c += 1
+                t = totals[j]
+                lo = t if t < lo else lo
+                hi = t if t > hi else hi
+        spread = hi - lo
+
+        acc = 0.0
+        for r in range(c):
+            s = (totals[cand[r]] - lo) / spread if spread > 0 else 0.5
+            acc += np.exp(-alpha * s)
+            cdf[r] = acc
+        u = rng.random() * acc
+        pick = c - 1
+        for r in range(c):
+            if cdf[r] > u:
+                pick = r
+                break
+
+        selected = cand[pick]
+        unscheduled[selected] = False
+        if i % 2 == 1:
+            seq[centre - (i + 1) // 2] = selected
+        else:
+            seq[centre + i // 2] = selected
+    return seq
+
+
+def randomized_constructive_heuristic(processing_times: Union[np.ndarray, PreparedInstance], 
                                     method: str = 'alpha', 
                                     param: Union[float, int] = None,
-                                    seed: Optional[int] = None) -> List[int]:
+                                    seed: Union[int, np.random.Generator, None] = None,
+                                    job_totals: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Randomized constructive heuristic with either alpha or k-best randomization.
     
     Args:
         processing_times: Matrix where processing_times[i][j] represents 
-                         processing time of job i on machine j
+                         processing time of job i on machine j, or a
+                         PreparedInstance built by prepare_instance
         method: 'alpha' for alpha-randomization OR 'kbest' for k-best selection
         param: alpha value (0-1) for 'alpha' OR k value (integer) for 'kbest'
-        seed: Random seed for reproducibility
+        seed: Random seed for reproducibility, or a np.random.Generator to draw
+              from; global random state is never touched
+        job_totals: Optional precomputed result of compute_job_totals
         
     Returns:
-        List of job indices representing the constructed sequence
+        Sequence of job indices (int32 ndarray) representing the constructed sequence
     """
-    if seed is not None:
-        random.seed(seed)
-        np.random.seed(seed)
-    
-    if not processing_times:
-        return []
+    rng = np.random.default_rng(seed)
     
-    num_jobs = len(processing_times)
-    unscheduled = set(range(num_jobs))
-    sequence = []
+    # Job characteristics (one vectorized row sum for all totals)
+    job_totals, first_machine = _job_features(processing_times, job_totals)
+    num_jobs = len(job_totals)
+    if num_jobs == 0:
+        return np.empty(0, dtype=np.int32)
     
-    # Calculate job characteristics
-    job_totals = [calculate_total_processing_time(processing_times, j) for j in range(num_jobs)]
-    first_machine = [processing_times[j][0] for j in range(num_jobs)]
+    unscheduled = np.ones(num_jobs, dtype=bool)
+    sequence = deque()
+
+    # With Numba the whole alpha construction runs as one compiled loop
+    if method == 'alpha' and NUMBA_AVAILABLE:
+        if num_jobs > 1 and (param is None or not (0 < param < 1)):
+            raise ValueError("alpha param must be between 0 and 1")
+        return _alpha_construct_kernel(job_totals, np.ascontiguousarray(first_machine),
+                                       float(param or 0.0), rng)
     
     # Start with the job that has minimum processing time on first machine
-    if unscheduled:
-        first_job = min(unscheduled, key=lambda j: first_machine[j])
-        sequence.append(first_job)
-        unscheduled.remove(first_job)
+    first_job = int(np.argmin(first_machine))
+    sequence.append(first_job)
+    unscheduled[first_job] = False
     
-    while unscheduled:
-        candidates = list(unscheduled)
+    for _ in range(num_jobs - 1):
+        # Unscheduled job ids in ascending order, straight from the mask
+        candidates = np.flatnonzero(unscheduled)
         
         if method == 'alpha':
             # Alpha-randomized greedy
             if param is None or not (0 < param < 1):
                 raise ValueError("alpha param must be between 0 and 1")
                 
-            scores = [job_totals[j] for j in candidates]
-            
-            # Normalize scores (lower is better)
-            min_score, max_score = min(scores), max(scores)
-            if max_score > min_score:
-                normalized = [(s - min_score) / (max_score - min_score) for s in scores]
+            if _compute_probs_c is not None:
+                probs = _compute_probs_c(np.ascontiguousarray(job_totals),
+                                         unscheduled.view(np.uint8), float(param))
             else:
-                normalized = [0.5] * len(scores)
-            
-            # Calculate probabilities using exponential bias
-            probs = [np.exp(-param * s) for s in normalized]
-            probs = [p/sum(probs) for p in probs]
+                scores = job_totals[candidates]
+                
+                # Normalize scores (lower is better); a flat range gives uniform odds
+                spread = np.ptp(scores)
+                normalized = (scores - scores.min()) / spread if spread > 0 else np.full(len(scores), 0.5)
+                
+                # Calculate probabilities using exponential bias (one array pass each)
+                probs = np.exp(-param * normalized)
+                probs /= probs.sum()
             
             # Select candidate
-            selected = np.random.choice(candidates, p=probs)
+            selected = rng.choice(candidates, p=probs)
             
         elif method == 'kbest':
             # k-best greedy
             if param is None or param < 1:
                 raise ValueError("k param must be >= 1")
                 
-            k = min(int(param), len(unscheduled))
+            k = min(int(param), len(candidates))
             
-            # Get top k candidates by total processing time
-            candidates_sorted = sorted(candidates, key=lambda j: job_totals[j])
-            selected = random.choice(candidates_sorted[:k])
+            # Get top k candidates by total processing time. A partial
+            # selection finds the k-th smallest total in O(n); ties at that
+            # value are taken in candidate order, then the k winners are
+            # ordered by total, exactly as a stable full sort would list them
+            totals = job_totals[candidates]
+            if k < len(candidates):
+                kth = np.partition(totals, k - 1)[k - 1]
+                below = np.flatnonzero(totals < kth)
+                ties = np.flatnonzero(totals == kth)[:k - len(below)]
+                top = np.concatenate((below, ties))
+            else:
+                top = np.arange(len(candidates))
+            top = top[np.argsort(totals[top], kind='stable')]
+            selected = candidates[top[int(rng.integers(0, k))]]
             
         else:
             raise ValueError("method must be either 'alpha' or 'kbest'")
         
-        sequence.append(selected)
-        unscheduled.remove(selected)
+        unscheduled[selected] = False
         
-        # Pendulum effect: alternate between front and back
-        if len(sequence) > 1:
-            if len(sequence) % 2 == 0:
-                sequence = [sequence[-1]] + sequence[:-1]
+        # Pendulum effect: alternate between front and back. A job that makes
+        # the length even goes to the front, so both ends are O(1) deque ops.
+        if len(sequence) % 2 == 1:
+            sequence.appendleft(selected)
+        else:
+            sequence.append(selected)
     
-    return sequence
+    return np.asarray(sequence, dtype=np.int32)
+
+
+# Per-process instance for multi_start_construction, set once by the initializer
+_worker_instance: Optional[PreparedInstance] = None
+
+
+def _init_multi_start_worker(processing_times: np.ndarray) -> None:
+    global _worker_instance
+    _worker_instance = prepare_instance(processing_times)
+
+
+def _multi_start_task(task: Tuple[str, Union[float, int], int]) -> np.ndarray:
+    method, param, seed = task
+    return randomized_constructive_heuristic(_worker_instance, method=method, param=param, seed=seed)
+
+
+def multi_start_construction(processing_times: Union[np.ndarray, PreparedInstance],
+                             num_starts: int,
+                             method: str = 'alpha',
+                             param: Union[float, int] = None,
+                             first_seed: int = 0,
+                             max_workers: Optional[int] = None) -> List[np.ndarray]:
+    """
+    Run randomized_constructive_heuristic for several seeds in parallel processes.
+
+    The matrix is sent to each worker once through the pool initializer rather
+    than with every task, so only the (method, param, seed) triples travel.
+    Workers are spawned, so a calling script needs the usual
+    if __name__ == '__main__' guard.
+    
+    Args:
+        processing_times: Matrix of processing times or a PreparedInstance
+        num_starts: Number of constructions; seeds are first_seed, first_seed+1, ...
+        method: 'alpha' or 'kbest', as in randomized_constructive_heuristic
+        param: alpha value or k value for the chosen method
+        first_seed: Seed of the first construction
+        max_workers: Number of worker processes (default: one per CPU, at most num_starts)
+        
+    Returns:
+        List of sequences in seed order, identical to sequential calls
+    """
+    if num_starts <= 0:
+        return []
+    if isinstance(processing_times, PreparedInstance):
+        processing_times = processing_times.P
+    P = np.ascontiguousarray(processing_times)
+
+    if max_workers is None:
+        max_workers = min(num_starts, os.cpu_count() or 1)
+    tasks = [(method, param, first_seed + i) for i in range(num_starts)]
+    # Workers are spawned, not forked: a child forked after Numba's parallel
+    # kernels have started their thread pool can deadlock
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_multi_start_worker,
+                             initargs=(P,)) as executor:
+        return list(executor.map(_multi_start_task, tasks))
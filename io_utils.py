@@ -7,55 +7,80 @@ Taillard-style TXT/FSP instances as well.
 """
 
 import csv
+import mmap
 import os
 import re
-from typing import List, Tuple
+import threading
+import warnings
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+# print_data_summary lists at most this many job names
+_MAX_LISTED_JOBS = 10
 
-def detect_csv_format(file_path: str) -> Tuple[bool, int, int]:
+# LRU memo of parsed instances used by read_instance
+_INSTANCE_CACHE_SIZE = 64
+_instance_cache: "OrderedDict[tuple, Tuple[np.ndarray, List[str]]]" = OrderedDict()
+_instance_cache_lock = threading.Lock()
+
+
+def _sniff_csv(file) -> Tuple[bool, str, List[List[str]]]:
     """
-    Detect if CSV has headers and determine dimensions.
+    Sniff the delimiter and header presence from an open CSV file.
+
+    Returns (has_headers, delimiter, first_rows) with up to two parsed rows;
+    the file is left positioned at its start.
     """
+    sample = file.read(1024)
+    if not sample:
+        raise ValueError("CSV file is empty")
+
     try:
-        with open(file_path, 'r', newline='', encoding='utf-8') as file:
-            sample = file.read(1024)
-            if not sample:
-                raise ValueError("CSV file is empty")
+        sniffer = csv.Sniffer()
+        delimiter = sniffer.sniff(sample).delimiter
+    except Exception:
+        delimiter = ','
+
+    file.seek(0)
+    reader = csv.reader(file, delimiter=delimiter)
+    rows = []
+    for i, row in enumerate(reader):
+        if i < 2:
+            rows.append(row)
+        else:
+            break
+    file.seek(0)
 
-        try:
-            sniffer = csv.Sniffer()
-            delimiter = sniffer.sniff(sample).delimiter
-        except Exception:
-            delimiter = ','
+    if not rows:
+        raise ValueError("CSV file is empty")
 
-        with open(file_path, 'r', newline='', encoding='utf-8') as file:
-            reader = csv.reader(file, delimiter=delimiter)
-            rows = []
-            for i, row in enumerate(reader):
-                if i < 2:
-                    rows.append(row)
-                else:
-                    break
+    has_headers = False
+    try:
+        [float(x.strip()) for x in rows[0] if x.strip()]
+    except (ValueError, TypeError):
+        has_headers = True
 
-        if not rows:
-            raise ValueError("CSV file is empty")
+    return has_headers, delimiter, rows
 
-        first_row = rows[0]
-        second_row = rows[1] if len(rows) > 1 else None
 
-        has_headers = False
-        try:
-            [float(x.strip()) for x in first_row if x.strip()]
-        except (ValueError, TypeError):
-            has_headers = True
+def detect_csv_format(file_path: str) -> Tuple[bool, int, int]:
+    """
+    Detect if CSV has headers and determine dimensions.
+    """
+    try:
+        # One open: sniff from the head of the file, then rewind and count rows
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
+            has_headers, delimiter, rows = _sniff_csv(file)
 
-        if has_headers and second_row:
-            num_machines = len([x for x in second_row if x.strip()])
-        else:
-            num_machines = len([x for x in first_row if x.strip()])
+            first_row = rows[0]
+            second_row = rows[1] if len(rows) > 1 else None
+            if has_headers and second_row:
+                num_machines = len([x for x in second_row if x.strip()])
+            else:
+                num_machines = len([x for x in first_row if x.strip()])
 
-        with open(file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file, delimiter=delimiter)
             if has_headers:
                 next(reader)
@@ -67,48 +92,70 @@ def detect_csv_format(file_path: str) -> Tuple[bool, int, int]:
         raise ValueError(f"Error analyzing CSV format: {str(e)}")
 
 
-def read_csv_data(file_path: str) -> Tuple[List[List[float]], List[str]]:
+def read_csv_data(file_path: str, dtype=np.float64) -> Tuple[np.ndarray, List[str]]:
     """
     Read CSV file and return processing times matrix and job names.
-    """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"CSV file not found: {file_path}")
 
+    The matrix is a C-contiguous (num_jobs, num_machines) ndarray of the given dtype.
+    """
+    # Opening directly (rather than checking os.path.exists first) saves a
+    # stat and cannot race with the file disappearing in between
     try:
-        has_headers, num_jobs, _ = detect_csv_format(file_path)
-
-        df = pd.read_csv(file_path, header=0 if has_headers else None)
+        file = open(file_path, 'r', newline='', encoding='utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV file not found: {file_path}") from None
 
-        if has_headers:
-            job_names = [f"Job_{i+1}" for i in range(num_jobs)]
-        else:
-            job_names = [f"Job_{i+1}" for i in range(len(df))]
-
-        processing_times: List[List[float]] = []
-        for _, row in df.iterrows():
-            times: List[float] = []
-            for value in row:
-                if pd.notna(value) and str(value).strip():
-                    try:
-                        times.append(float(value))
-                    except (ValueError, TypeError):
-                        continue
-            if times:
-                processing_times.append(times)
-
-        if not processing_times:
+    try:
+        # Only header detection is needed here; row counting is left to pandas
+        try:
+            with file:
+                has_headers, _, _ = _sniff_csv(file)
+        except Exception as e:
+            raise ValueError(f"Error analyzing CSV format: {str(e)}")
+
+        # A plain numeric matrix (after the header line, if any) needs no
+        # DataFrame: NumPy's C parser reads it directly. Anything irregular
+        # (gaps, trailing delimiters, text, a header not on the first line)
+        # makes loadtxt raise, and the pandas path below handles it as before.
+        arr = None
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                arr = np.loadtxt(file_path, delimiter=',', dtype=np.float64, ndmin=2,
+                                 skiprows=1 if has_headers else 0)
+        except ValueError:
+            arr = None
+
+        if arr is None:
+            header = 0 if has_headers else None
+            try:
+                # The pandas C parser writes straight into float64 columns
+                arr = pd.read_csv(file_path, header=header, dtype=np.float64,
+                                  engine='c').to_numpy()
+            except ValueError:
+                # Some cell is not numeric; parse generically and coerce those to NaN
+                df = pd.read_csv(file_path, header=header)
+                arr = df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+
+        # Rows and columns that are entirely empty (blank lines, trailing
+        # delimiters, non-numeric cells) are dropped
+        valid = ~np.isnan(arr)
+        arr = arr[valid.any(axis=1)][:, valid.any(axis=0)]
+        valid = ~np.isnan(arr)
+
+        if arr.size == 0:
             raise ValueError("No valid processing time data found in CSV")
 
-        machine_counts = [len(job) for job in processing_times]
-        if len(set(machine_counts)) > 1:
-            raise ValueError(f"Inconsistent number of machines per job: {set(machine_counts)}")
+        machine_counts = valid.sum(axis=1)
+        if not valid.all():
+            raise ValueError(f"Inconsistent number of machines per job: {set(machine_counts.tolist())}")
 
-        for i, job_times in enumerate(processing_times):
-            for j, time in enumerate(job_times):
-                if time < 0:
-                    raise ValueError(f"Negative processing time found at Job {i+1}, Machine {j+1}: {time}")
+        if np.any(arr < 0):
+            i, j = np.argwhere(arr < 0)[0]
+            raise ValueError(f"Negative processing time found at Job {i+1}, Machine {j+1}: {arr[i, j]}")
 
-        return processing_times, job_names[:len(processing_times)]
+        job_names = [f"Job_{i+1}" for i in range(arr.shape[0])]
+        return np.ascontiguousarray(arr, dtype=dtype), job_names
 
     except pd.errors.EmptyDataError:
         raise ValueError("CSV file is empty")
@@ -118,132 +165,245 @@ def read_csv_data(file_path: str) -> Tuple[List[List[float]], List[str]]:
         raise ValueError(f"Error reading CSV data: {str(e)}")
 
 
-def validate_processing_times(processing_times: List[List[float]]) -> bool:
+def validate_processing_times(processing_times: np.ndarray) -> bool:
     """
     Validate the processing times matrix for logical consistency.
+    Accepts a 2-D ndarray or a list of lists.
     """
-    if not processing_times:
+    if len(processing_times) == 0:
         raise ValueError("Processing times matrix is empty")
 
-    if not all(isinstance(job, list) for job in processing_times):
-        raise ValueError("Processing times must be a list of lists")
-
-    num_machines = len(processing_times[0])
-    for i, job_times in enumerate(processing_times):
-        if len(job_times) != num_machines:
-            raise ValueError(f"Job {i+1} has {len(job_times)} machines, expected {num_machines}")
+    if isinstance(processing_times, np.ndarray):
+        if processing_times.ndim != 2:
+            raise ValueError("Processing times must be a 2-D matrix")
+        arr = processing_times
+    else:
+        if not all(isinstance(job, list) for job in processing_times):
+            raise ValueError("Processing times must be a list of lists")
 
+        num_machines = len(processing_times[0])
+        for i, job_times in enumerate(processing_times):
+            if len(job_times) != num_machines:
+                raise ValueError(f"Job {i+1} has {len(job_times)} machines, expected {num_machines}")
+        arr = np.asarray(processing_times)
+
+    if arr.dtype.kind in 'biuf':
+        # Numeric matrix: one vectorized comparison finds any negative entry
+        bad = np.argwhere(arr < 0)
+        if bad.size:
+            i, j = bad[0]
+            raise ValueError(f"Invalid processing time at Job {i+1}, Machine {j+1}: {processing_times[i][j]}")
+        return True
+
+    # Mixed or non-numeric entries: locate the first offender element-wise
     for i, job_times in enumerate(processing_times):
         for j, time in enumerate(job_times):
-            if not isinstance(time, (int, float)) or time < 0:
+            if not isinstance(time, (int, float, np.number)) or time < 0:
                 raise ValueError(f"Invalid processing time at Job {i+1}, Machine {j+1}: {time}")
 
     return True
 
 
-def print_data_summary(processing_times: List[List[float]], job_names: List[str]) -> None:
+def print_data_summary(processing_times: np.ndarray, job_names: List[str],
+                       total_processing: Optional[float] = None) -> None:
     """
     Print a summary of the loaded data.
+
+    total_processing, the sum of all processing times, can be passed when it
+    is already known (see heuristics.PreparedInstance) to skip that pass.
     """
-    num_jobs = len(processing_times)
-    num_machines = len(processing_times[0]) if processing_times else 0
+    if isinstance(processing_times, np.ndarray) and processing_times.ndim == 2:
+        num_jobs, num_machines = processing_times.shape
+    else:
+        num_jobs = len(processing_times)
+        num_machines = len(processing_times[0]) if num_jobs > 0 else 0
 
     print(f"\n=== Data Summary ===")
     print(f"Number of jobs: {num_jobs}")
     print(f"Number of machines: {num_machines}")
-    print(f"Job names: {', '.join(job_names)}")
-
-    all_times = [time for job in processing_times for time in job]
-    if all_times:
-        print(f"Processing time range: {min(all_times):.2f} - {max(all_times):.2f}")
-        print(f"Average processing time: {sum(all_times)/len(all_times):.2f}")
+    if len(job_names) > _MAX_LISTED_JOBS:
+        hidden = len(job_names) - _MAX_LISTED_JOBS
+        print(f"Job names: {', '.join(job_names[:_MAX_LISTED_JOBS])}, ... ({hidden} more)")
+    else:
+        print(f"Job names: {', '.join(job_names)}")
+
+    # min/max are exact in the stored dtype, so the matrix is not copied to
+    # float64 just for the summary
+    arr = np.asarray(processing_times)
+    if arr.size:
+        if total_processing is None:
+            total_processing = float(arr.sum(dtype=np.float64))
+        print(f"Processing time range: {float(arr.min()):.2f} - {float(arr.max()):.2f}")
+        print(f"Average processing time: {total_processing / arr.size:.2f}")
     print("=" * 20)
 
 
-def read_taillard_txt(file_path: str) -> Tuple[List[List[float]], List[str]]:
+def _exact_in_float32(values: np.ndarray) -> bool:
+    """Return True if every value is an integer that float32 stores exactly."""
+    if values.size == 0:
+        return True
+    return bool(np.all(np.mod(values, 1) == 0) and np.abs(values).max() <= 2**24)
+
+
+def read_taillard_txt(file_path: str, dtype=np.float32) -> Tuple[np.ndarray, List[str]]:
     """
     Read a Flow Shop instance in Taillard-style TXT/FSP format.
     
     Note: Taillard format stores data as MACHINES-AS-ROWS (JOBS-AS-COLUMNS).
     Each row in the file represents one machine, with values for all jobs.
     This function reads the file format and TRANSPOSES it to the expected
-    jobs-as-rows format (each row = one job, each column = one machine).
-    """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"TXT/FSP file not found: {file_path}")
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    n = m = None
-    look_for_counts_next = False
-    for line in lines:
-        l = line.strip().lower()
-        if 'number of jobs' in l and 'number of machines' in l:
-            look_for_counts_next = True
-            continue
-        if look_for_counts_next:
-            ints = re.findall(r"-?\d+", line)
-            if len(ints) >= 2:
-                n = int(ints[0])  # number of jobs
-                m = int(ints[1])  # number of machines
-                break
-    if n is None or m is None:
-        raise ValueError("Could not parse number of jobs and machines from TXT header.")
-
-    # Taillard format: file has M rows (machines) with N values each (jobs)
-    # Read all tokens first, then organize as machines-as-rows, then transpose to jobs-as-rows
-    proc_tokens: List[float] = []
-    collecting = False
-    for line in lines:
-        if not collecting:
-            if 'processing times' in line.strip().lower():
-                collecting = True
-            continue
-        if collecting:
-            ints = re.findall(r"-?\d+", line)
-            proc_tokens.extend(float(x) for x in ints)
-            if len(proc_tokens) >= n * m:
-                break
-
-    if len(proc_tokens) < n * m:
-        raise ValueError(f"Expected {n*m} processing times, found {len(proc_tokens)}.")
-
-    # Organize tokens as machines-as-rows (m rows, n columns)
+    jobs-as-rows format (each row = one job, each column = one machine),
+    returned as a C-contiguous (n, m) ndarray of the given dtype.
+
+    Taillard times are small integers, so float32 (the default) stores them
+    exactly at half the memory traffic of float64; the makespan kernels still
+    accumulate in float64. Files with fractional times, or with integers
+    beyond 2**24, are kept in float64 even then, since float32 would round
+    them.
+    """
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"TXT/FSP file not found: {file_path}") from None
+
+    with f:
+        # Only the short header is decoded and tokenized in Python; the
+        # processing times are located in the memory map and parsed in C
+        header = b''
+        data_start = None
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                marker = re.search(rb'processing times', mm, re.IGNORECASE)
+                marker_pos = marker.start() if marker is not None else -1
+                del marker  # release the match's view so the map can close
+                if marker_pos >= 0:
+                    line_end = mm.find(b'\n', marker_pos)
+                    data_start = len(mm) if line_end < 0 else line_end + 1
+                    header = mm[:marker_pos]
+                else:
+                    header = mm[:]
+        lines = header.decode('utf-8').splitlines()
+
+        n = m = None
+        look_for_counts_next = False
+        for line in lines:
+            l = line.strip().lower()
+            if 'number of jobs' in l and 'number of machines' in l:
+                look_for_counts_next = True
+                continue
+            if look_for_counts_next:
+                ints = re.findall(r"-?\d+", line)
+                if len(ints) >= 2:
+                    n = int(ints[0])  # number of jobs
+                    m = int(ints[1])  # number of machines
+                    break
+        if n is None or m is None:
+            raise ValueError("Could not parse number of jobs and machines from TXT header.")
+
+        # Taillard format: file has M rows (machines) with N values each (jobs).
+        # np.fromfile scans the whitespace-separated values after the marker
+        # straight into a flat buffer, stopping after n*m values.
+        proc_values = np.empty(0)
+        if data_start is not None:
+            f.seek(data_start)
+            try:
+                proc_values = np.fromfile(f, count=n * m, sep=' ')
+            except ValueError:
+                # Anything but whitespace between the values (NumPy 2 raises)
+                proc_values = np.empty(0)
+            if len(proc_values) < n * m:
+                # Commas, labels or other text in the block: fall back to
+                # picking out the numeric tokens, as the line reader did
+                f.seek(data_start)
+                tokens = re.findall(rb"-?\d+(?:\.\d+)?", f.read())[:n * m]
+                proc_values = np.array([float(t) for t in tokens])
+
+    if len(proc_values) < n * m:
+        raise ValueError(f"Expected {n*m} processing times, found {len(proc_values)}.")
+    if dtype == np.float32 and not _exact_in_float32(proc_values):
+        dtype = np.float64
+
+    # Organize values as machines-as-rows (m rows, n columns)
     # Each row in file represents one machine with times for all jobs
-    machines_data: List[List[float]] = []
-    idx = 0
-    for machine_idx in range(m):
-        row = proc_tokens[idx: idx + n]
-        if len(row) != n:
-            raise ValueError(f"Machine {machine_idx} row incomplete: expected {n} values, found {len(row)}")
-        machines_data.append(row)
-        idx += n
+    machines_data = proc_values.reshape(m, n)
 
     # Transpose: convert from machines-as-rows to jobs-as-rows
     # machines_data[i][j] = time for job j on machine i
     # processing_times[i][j] = time for job i on machine j (expected format)
-    processing_times: List[List[float]] = []
-    for job_idx in range(n):
-        job_times = [machines_data[machine_idx][job_idx] for machine_idx in range(m)]
-        processing_times.append(job_times)
+    processing_times = np.ascontiguousarray(machines_data.T, dtype=dtype)
 
     job_names = [f"Job_{i+1}" for i in range(n)]
     return processing_times, job_names
 
 
-def read_instance(file_path: str) -> Tuple[List[List[float]], List[str]]:
+def compact_integer_times(processing_times: np.ndarray) -> np.ndarray:
+    """
+    Return the matrix in the narrowest integer dtype that holds it exactly.
+
+    Non-negative integral matrices become int16 or int32, picked so that even
+    the sum of all times fits; since no completion time can exceed that sum,
+    makespan arithmetic in the stored dtype cannot overflow either. Any other
+    matrix is returned unchanged.
+    """
+    arr = np.asarray(processing_times)
+    if arr.size == 0 or not np.issubdtype(arr.dtype, np.number):
+        return arr
+    if np.any(arr < 0) or not np.all(np.mod(arr, 1) == 0):
+        return arr
+    total = arr.sum(dtype=np.float64)
+    for candidate in (np.int16, np.int32):
+        if total <= np.iinfo(candidate).max:
+            return np.ascontiguousarray(arr, dtype=candidate)
+    return arr
+
+
+def read_instance(file_path: str, dtype=None, compact: bool = False) -> Tuple[np.ndarray, List[str]]:
     """
     Dispatch reader based on extension:
     - .csv via read_csv_data
     - .txt/.fsp via read_taillard_txt
+
+    dtype overrides the reader's default storage type (float64 for CSV,
+    float32 for Taillard files). With compact=True integer-valued instances
+    are narrowed further via compact_integer_times.
+
+    Parsed instances are memoized per (path, mtime, size, dtype, compact), so
+    re-reading an unchanged file in the same process skips the parse; every
+    call still returns its own copy of the matrix.
     """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return _read_instance_uncached(file_path, dtype, compact)
+
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, str(dtype), compact)
+    with _instance_cache_lock:
+        cached = _instance_cache.get(key)
+        if cached is not None:
+            _instance_cache.move_to_end(key)
+    if cached is None:
+        cached = _read_instance_uncached(file_path, dtype, compact)
+        with _instance_cache_lock:
+            _instance_cache[key] = cached
+            if len(_instance_cache) > _INSTANCE_CACHE_SIZE:
+                _instance_cache.popitem(last=False)
+
+    processing_times, job_names = cached
+    return processing_times.copy(), list(job_names)
+
+
+def _read_instance_uncached(file_path: str, dtype, compact: bool) -> Tuple[np.ndarray, List[str]]:
+    kwargs = {} if dtype is None else {'dtype': dtype}
     ext = os.path.splitext(file_path)[1].lower()
     if ext == '.csv':
-        return read_csv_data(file_path)
-    if ext in ('.txt', '.fsp'):
-        return read_taillard_txt(file_path)
-    try:
-        return read_csv_data(file_path)
-    except Exception:
-        return read_taillard_txt(file_path)
\ No newline at end of file
+        processing_times, job_names = read_csv_data(file_path, **kwargs)
+    elif ext in ('.txt', '.fsp'):
+        processing_times, job_names = read_taillard_txt(file_path, **kwargs)
+    else:
+        try:
+            processing_times, job_names = read_csv_data(file_path, **kwargs)
+        except Exception:
+            processing_times, job_names = read_taillard_txt(file_path, **kwargs)
+    if compact:
+        processing_times = compact_integer_times(processing_times)
+    return processing_times, job_names
\ No newline at end of file
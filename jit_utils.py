@@ -0,0 +1,24 @@
+"""
+Optional Numba support for the Flow Shop Scheduling Problem solver.
+
+Numba is not a hard requirement. When it is installed, ``njit`` compiles the
+numeric kernels in ``makespan.py`` and friends to machine code; when it is
+missing, ``njit`` is a no-op decorator and the very same kernels run as plain
+Python, so results are identical either way.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
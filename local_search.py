@@ -6,8 +6,15 @@ to improve solutions found by the constructive heuristic.
 """
 
 from typing import List, Tuple, Optional
+import multiprocessing
+import os
 import time
-from heuristics import calculate_total_processing_time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from heuristics import compute_job_totals
+
+# The intensification loop reads the clock only every this many steps
+_BUDGET_CHECK_INTERVAL = 32
 
 def identify_bottleneck_machine(processing_times: List[List[float]]) -> int:
     """
@@ -20,10 +27,22 @@ def identify_bottleneck_machine(processing_times: List[List[float]]) -> int:
     Returns:
         Index of the bottleneck machine (0-based)
     """
-    if not processing_times or not processing_times[0]:
+    P = np.asarray(processing_times)
+    if P.ndim != 2 or P.size == 0:
         return 0
-    machine_totals = [sum(machine_times) for machine_times in zip(*processing_times)]
-    return machine_totals.index(max(machine_totals))
+    # One column-sum reduction; argmax keeps the first machine on ties
+    return int(P.sum(axis=0).argmax())
+
+def bottleneck_threshold(bn_proc: np.ndarray, quantile: float = 0.8) -> float:
+    """
+    Bottleneck processing time at or above which a job counts as critical.
+
+    Picks the element at index int(quantile * (n - 1)) of the sorted times with
+    a linear-time partition instead of sorting all of them.
+    """
+    bn_proc = np.asarray(bn_proc)
+    q_index = max(0, min(bn_proc.shape[0] - 1, int(quantile * (bn_proc.shape[0] - 1))))
+    return float(np.partition(bn_proc, q_index)[q_index])
 
 def score_adjacent_pair(sequence: List[int], pos: int, 
                        processing_times: List[List[float]], 
@@ -53,15 +72,11 @@ def score_adjacent_pair(sequence: List[int], pos: int,
 
     # Pendulum-aligned bias: heavier jobs closer to center, lighter jobs to ends
     center = (n - 1) / 2.0
-    dist1_c_before = abs(pos - center)
-    dist2_c_before = abs((pos + 1) - center)
     # Identify heavier/lighter on total load
     if job_totals[job1] >= job_totals[job2]:
         heavy_pos_before, light_pos_before = pos, pos + 1
-        heavy_job, light_job = job1, job2
     else:
         heavy_pos_before, light_pos_before = pos + 1, pos
-        heavy_job, light_job = job2, job1
     # After swap, positions invert for the two jobs in this pair
     heavy_pos_after = pos if heavy_pos_before == pos + 1 else pos + 1
     light_pos_after = pos if light_pos_before == pos + 1 else pos + 1
@@ -77,32 +92,19 @@ def score_adjacent_pair(sequence: List[int], pos: int,
     alpha, beta = 9.0, 4.0
     pendulum_bias = alpha * centrality_gain + beta * end_bias_gain
 
-    # Neighborhood smoothness: prefer reducing local total-load roughness
-    # Consider indices [pos-1, pos, pos+1, pos+2] where defined
-    idxs_before = []
-    for k in (pos-1, pos, pos+1):
-        if 0 <= k < n-1:
-            a, b = sequence[k], sequence[k+1]
-            idxs_before.append(abs(job_totals[a] - job_totals[b]))
-    rough_before = sum(idxs_before)
-
-    # After swap, compute roughness on the same k windows impacted
-    tmp_seq = sequence
-    a1, a2 = tmp_seq[pos], tmp_seq[pos+1]
-    swapped_pair = (a2, a1)
-    # Helper to get element at position k after swap without copying entire seq
-    def after(k: int) -> int:
-        if k == pos:
-            return swapped_pair[0]
-        if k == pos+1:
-            return swapped_pair[1]
-        return tmp_seq[k]
-    idxs_after = []
-    for k in (pos-1, pos, pos+1):
-        if 0 <= k < n-1:
-            x, y = after(k), after(k+1)
-            idxs_after.append(abs(job_totals[x] - job_totals[y]))
-    rough_after = sum(idxs_after)
+    # Neighborhood smoothness: prefer reducing local total-load roughness over
+    # the windows pos-1, pos and pos+1. The middle window keeps its difference
+    # under the swap, so only the two outer windows (where defined) change:
+    # each swaps the job it shares with the pair.
+    rough_before = rough_after = 0.0
+    if pos - 1 >= 0:
+        left = job_totals[sequence[pos - 1]]
+        rough_before += abs(left - job_totals[job1])
+        rough_after += abs(left - job_totals[job2])
+    if pos + 2 < n:
+        right = job_totals[sequence[pos + 2]]
+        rough_before += abs(job_totals[job2] - right)
+        rough_after += abs(job_totals[job1] - right)
     smooth_gain = max(0.0, rough_before - rough_after)
     gamma = 1.5
 
@@ -113,9 +115,143 @@ def score_adjacent_pair(sequence: List[int], pos: int,
 
     return bottleneck_diff + total_diff + pendulum_bias + gamma * smooth_gain + bonus
 
+def _score_pair_range(seq: np.ndarray, lo: int, hi: int,
+                      job_totals: np.ndarray,
+                      bn_proc: np.ndarray,
+                      bn_threshold: float) -> np.ndarray:
+    # Vectorized score_adjacent_pair for the pairs at positions lo..hi-1
+    n = seq.shape[0]
+    pos = np.arange(lo, hi)
+    first, second = seq[lo:hi], seq[lo + 1:hi + 1]
+    tot1, tot2 = job_totals[first], job_totals[second]
+    bn1, bn2 = bn_proc[first], bn_proc[second]
+
+    # Difference on bottleneck machine and in total processing time
+    bottleneck_diff = np.abs(bn1 - bn2)
+    total_diff = np.abs(tot1 - tot2)
+
+    # Pendulum-aligned bias: the heavier job of a pair moves to the other slot,
+    # and so does the lighter one
+    center = (n - 1) / 2.0
+    heavy_first = tot1 >= tot2
+    heavy_before = np.where(heavy_first, pos, pos + 1)
+    heavy_after = np.where(heavy_first, pos + 1, pos)
+    light_before, light_after = heavy_after, heavy_before
+    centrality_gain = np.maximum(0.0, np.abs(heavy_before - center) - np.abs(heavy_after - center))
+    end_dist_light_before = np.minimum(light_before, (n - 1) - light_before)
+    end_dist_light_after = np.minimum(light_after, (n - 1) - light_after)
+    end_bias_gain = np.maximum(0.0, end_dist_light_after - end_dist_light_before)
+    pendulum_bias = 9.0 * centrality_gain + 4.0 * end_bias_gain
+
+    # Neighborhood smoothness over the windows pos-1, pos and pos+1. The middle
+    # window keeps its difference and cancels out; in the outer two the swap
+    # exchanges the job shared with the pair. Missing windows count 0.
+    has_left = pos >= 1
+    has_right = pos + 2 < n
+    left = job_totals[seq[np.maximum(pos - 1, 0)]]
+    right = job_totals[seq[np.minimum(pos + 2, n - 1)]]
+    rough_before = (np.where(has_left, np.abs(left - tot1), 0.0)
+                    + np.where(has_right, np.abs(tot2 - right), 0.0))
+    rough_after = (np.where(has_left, np.abs(left - tot2), 0.0)
+                   + np.where(has_right, np.abs(tot1 - right), 0.0))
+    smooth_gain = np.maximum(0.0, rough_before - rough_after)
+
+    # Bottleneck criticality bonus for pairs involving a critical job
+    bonus = np.where((bn1 >= bn_threshold) | (bn2 >= bn_threshold), 5.0, 0.0)
+
+    return bottleneck_diff + total_diff + pendulum_bias + 1.5 * smooth_gain + bonus
+
+def score_all_pairs(sequence: List[int],
+                    job_totals: np.ndarray,
+                    bn_proc: np.ndarray,
+                    bn_threshold: float) -> np.ndarray:
+    """
+    Score every adjacent pair of the sequence at once (vectorized score_adjacent_pair).
+    
+    Args:
+        sequence: Current job sequence
+        job_totals: Per-job total processing times (ndarray)
+        bn_proc: Per-job processing times on the bottleneck machine (ndarray)
+        bn_threshold: Bottleneck time at or above which a job counts as critical
+        
+    Returns:
+        Array whose entry pos is the score of swapping pos and pos+1
+    """
+    seq = np.asarray(sequence)
+    n = seq.shape[0]
+    if n < 2:
+        return np.empty(0)
+    return _score_pair_range(seq, 0, n - 1, job_totals, bn_proc, bn_threshold)
+
+def rescore_after_swap(scores: np.ndarray,
+                       sequence: List[int],
+                       swap_pos: int,
+                       job_totals: np.ndarray,
+                       bn_proc: np.ndarray,
+                       bn_threshold: float) -> np.ndarray:
+    """
+    Update scores in place after the jobs at swap_pos and swap_pos+1 were swapped.
+
+    A pair score only looks at the jobs from pos-1 to pos+2, so just the
+    pairs swap_pos-2 .. swap_pos+2 can change; the rest are kept.
+
+    Args:
+        scores: Scores of the sequence before the swap (see score_all_pairs)
+        sequence: Job sequence after the swap
+        swap_pos: Position of the applied swap
+        job_totals: Per-job total processing times (ndarray)
+        bn_proc: Per-job processing times on the bottleneck machine (ndarray)
+        bn_threshold: Bottleneck time at or above which a job counts as critical
+
+    Returns:
+        The updated scores array
+    """
+    seq = np.asarray(sequence)
+    lo = max(0, swap_pos - 2)
+    hi = min(seq.shape[0] - 1, swap_pos + 3)
+    scores[lo:hi] = _score_pair_range(seq, lo, hi, job_totals, bn_proc, bn_threshold)
+    return scores
+
+def select_top_pairs(scores: np.ndarray, top_k: int,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Return the positions of the top_k best-scored pairs, best first.
+
+    Positions are ranked by score descending with ties broken by position, via
+    a stable argsort. When only a prefix is needed, the pairs that can reach
+    it are first selected with a linear-time partition and only those are sorted.
+
+    Args:
+        scores: Array whose entry pos is the score of the pair (pos, pos+1)
+        top_k: Number of positions to return
+        out: Optional int64 buffer (at least top_k long) that receives the
+             positions; a view of its prefix is returned instead of a new array
+
+    Returns:
+        int64 array of at most top_k positions
+    """
+    neg = -np.asarray(scores, dtype=np.float64)
+    if 0 < top_k < neg.shape[0]:
+        # Every pair scoring at least the top_k-th best; ties at the boundary
+        # stay in position order, so the stable sort below decides them
+        kth = np.partition(neg, top_k - 1)[top_k - 1]
+        candidates = np.flatnonzero(neg <= kth)
+        order = candidates[np.argsort(neg[candidates], kind='stable')]
+    else:
+        order = np.argsort(neg, kind='stable')
+    order = order[:max(top_k, 0)]
+    if out is None:
+        return order.astype(np.int64, copy=False)
+    top = out[:order.shape[0]]
+    top[:] = order
+    return top
+
 def swap_adjacent(sequence: List[int], pos: int) -> List[int]:
     """
     Create a new sequence with jobs at pos and pos+1 swapped.
+
+    Kept for external callers; local_search_main and evaluate_insertion_delta
+    swap in place instead of copying the sequence per move.
     
     Args:
         sequence: Current job sequence
@@ -134,34 +270,57 @@ def evaluate_insertion_delta(processing_times: List[List[float]],
                              sequence: List[int],
                              from_pos: int,
                              to_pos: int,
-                             completion_times: List[List[float]]) -> Tuple[List[int], float, List[List[float]]]:
+                             completion_times: List[List[float]],
+                             in_place: bool = False) -> Tuple[List[int], float, List[List[float]]]:
     """
-    Move job at from_pos to to_pos via a sequence of adjacent swaps, using
-    calculate_makespan_delta at each micro-step to keep evaluation fast.
+    Move job at from_pos to to_pos and update the makespan incrementally.
+
+    The move is applied directly (the same result as a chain of adjacent
+    swaps), then the completion rows from min(from_pos, to_pos) onward are
+    recomputed once; rows before it are untouched by the move. This is never
+    more work than a single micro-swap delta, whatever the move distance.
+
+    The sequence and completion matrix are copied once. With in_place, the
+    caller's own sequence and matrix are updated and nothing is copied.
 
     Returns (new_sequence, new_makespan, new_completion_times).
     """
     n = len(sequence)
     if from_pos == to_pos or n <= 1:
-        return sequence.copy(), (completion_times[-1][-1] if completion_times else calculate_makespan(processing_times, sequence)), [row[:] for row in completion_times]
-
-    seq = sequence.copy()
-    ct = [row[:] for row in completion_times]
-    current_mk = ct[-1][-1] if ct else calculate_makespan(processing_times, seq)
-
-    # Determine direction and perform adjacent micro-swaps
-    step = 1 if to_pos > from_pos else -1
-    pos = from_pos
-    while pos != to_pos:
-        swap_pos = pos if step == 1 else pos - 1
-        new_mk, new_ct = calculate_makespan_delta(processing_times, seq, swap_pos, ct)
-        # Apply the swap to the sequence deterministically
-        seq[swap_pos], seq[swap_pos + 1] = seq[swap_pos + 1], seq[swap_pos]
-        ct = new_ct
-        current_mk = new_mk
-        pos += step
+        if in_place:
+            return sequence, (completion_times[-1][-1] if completion_times else calculate_makespan(processing_times, sequence, validate=False)), completion_times
+        return sequence.copy(), (completion_times[-1][-1] if completion_times else calculate_makespan(processing_times, sequence, validate=False)), [row[:] for row in completion_times]
+
+    seq = sequence if in_place else sequence.copy()
+    if not completion_times:
+        ct = calculate_completion_times(processing_times, seq)
+    else:
+        ct = completion_times if in_place else [row[:] for row in completion_times]
+
+    # Shift the jobs in between by one slot and drop the moved job in place
+    moved_job = seq[from_pos]
+    if to_pos < from_pos:
+        seq[to_pos + 1:from_pos + 1] = seq[to_pos:from_pos]
+    else:
+        seq[from_pos:to_pos] = seq[from_pos + 1:to_pos + 1]
+    seq[to_pos] = moved_job
+    current_mk = update_completion_times(processing_times, seq, ct, min(from_pos, to_pos))
     return seq, current_mk, ct
 
+def _scan_first(processing_times, sequence, completion_times, positions, current_makespan, executor):
+    # First-improvement: stop at the first swap (in ranking order) that helps
+    return find_first_improving_swap(
+        processing_times, sequence, completion_times, positions, current_makespan, executor
+    )
+
+def _scan_best(processing_times, sequence, completion_times, positions, current_makespan, executor):
+    # Best-improvement: price every candidate swap in one parallel call, then
+    # confirm the cheapest on the recurrence; the first best position wins
+    # ties, as the scan order did
+    return find_best_improving_swap(
+        processing_times, sequence, completion_times, positions, current_makespan
+    )
+
 def local_search_main(initial_sequence: List[int], 
                      processing_times: List[List[float]],
                      max_iterations: int = 400,
@@ -169,7 +328,9 @@ def local_search_main(initial_sequence: List[int],
                      verbose: bool = False,
                      search_mode: str = "best",
                      recompute_bottleneck: bool = True,
-                     time_budget_seconds: Optional[float] = 30.0) -> Tuple[List[int], float, int, float]:
+                     time_budget_seconds: Optional[float] = 30.0,
+                     job_totals: Optional[List[float]] = None,
+                     num_threads: int = 1) -> Tuple[List[int], float, int, float]:
     """
     Perform local search using bottleneck-aware adjacent swaps (deterministic first-improvement).
     
@@ -179,16 +340,21 @@ def local_search_main(initial_sequence: List[int],
         max_iterations: Maximum number of iterations (increased to 50)
         top_k: Number of top pairs to consider in each iteration
         verbose: Whether to print progress
+        recompute_bottleneck: Kept for compatibility; the bottleneck machine and
+                              its statistics depend only on the processing
+                              times, so they are computed once per search
+        job_totals: Optional precomputed per-job totals (see compute_job_totals)
+        num_threads: Threads used to scan swap candidates in parallel (effective
+                     with Numba on large instances; results do not depend on it)
         
     Returns:
         Tuple of (best_sequence, best_makespan, iterations_used, search_time)
     """
     # Input validation
-    if not initial_sequence or not processing_times:
+    if len(initial_sequence) == 0 or len(processing_times) == 0:
         return initial_sequence, 0.0, 0, 0.0
     
-    num_jobs = len(processing_times)
-    num_machines = len(processing_times[0]) if num_jobs > 0 else 0
+    num_jobs = matrix_shape(processing_times)[0]
     
     if len(initial_sequence) != num_jobs:
         raise ValueError("Sequence length must match number of jobs")
@@ -197,29 +363,47 @@ def local_search_main(initial_sequence: List[int],
         makespan = calculate_makespan(processing_times, initial_sequence)
         return initial_sequence, makespan, 0, 0.0
     
-    # Initialize
-    current_sequence = initial_sequence.copy()
+    # Initialize: the working sequence is a contiguous int32 buffer that is
+    # updated in place; it is converted back to a list only on return
+    current_sequence = np.array(initial_sequence, dtype=np.int32)
     current_makespan = calculate_makespan(processing_times, current_sequence)
     best_sequence = current_sequence.copy()
     best_makespan = current_makespan
     # Cache completion times to enable fast delta evaluations
     completion_times = calculate_completion_times(processing_times, current_sequence)
+    # Second matrix of the same shape for the guided perturbation (created on first use)
+    spare_ct = None
+    # The bottleneck depends only on the processing times, so it is found once
     bottleneck_machine = identify_bottleneck_machine(processing_times)
 
-    # Precompute total processing time per job using existing helper
-    job_totals = [calculate_total_processing_time(processing_times, j) for j in range(num_jobs)]
+    # Precompute total processing time per job (one NumPy row sum unless supplied)
+    P_arr = np.asarray(processing_times)
+    if job_totals is None:
+        job_totals = compute_job_totals(P_arr)
+    job_totals = np.asarray(job_totals, dtype=np.float64)
 
-    # Precompute bottleneck processing times and criticality threshold (80th percentile)
-    bn_proc = [processing_times[j][bottleneck_machine] for j in range(num_jobs)]
-    sorted_bn = sorted(bn_proc)
-    q_index = max(0, min(len(sorted_bn) - 1, int(0.8 * (len(sorted_bn) - 1))))
-    bn_threshold = sorted_bn[q_index]
+    # Precompute bottleneck processing times and criticality threshold (80th
+    # percentile); like the bottleneck itself they never change during the search.
+    # The column is copied out of the job-major matrix once, so the scoring
+    # gathers read a contiguous vector instead of a stride-m view.
+    bn_proc = np.ascontiguousarray(P_arr[:, bottleneck_machine])
+    bn_threshold = bottleneck_threshold(bn_proc)
 
     # By default, consider all adjacent pairs for stronger improvement (still O(n))
+    n = num_jobs
     if top_k is None:
-        top_k = len(current_sequence) - 1
+        top_k = n - 1
     else:
-        top_k = min(top_k, len(current_sequence) - 1)
+        top_k = min(top_k, n - 1)
+
+    # Ranked candidate positions are written into one reusable buffer
+    top_pairs_buf = np.empty(max(top_k, 0), dtype=np.int64)
+
+    # The neighborhood scan is chosen once rather than per intensification step
+    scan = _scan_first if search_mode == "first" else _scan_best
+
+    # Thread pool for the compiled first-improvement scans, created once per search
+    executor = ThreadPoolExecutor(max_workers=num_threads) if num_threads > 1 else None
 
     iterations_used = 0
     start_time = time.perf_counter()
@@ -239,68 +423,38 @@ def local_search_main(initial_sequence: List[int],
             print(f"Current makespan: {current_makespan}")
 
         # Score all adjacent pairs (bottleneck + total load + pendulum bias)
-        scores = []
-        for pos in range(len(current_sequence) - 1):
-            score = score_adjacent_pair(current_sequence, pos, processing_times, bottleneck_machine, job_totals, len(current_sequence), bn_proc, bn_threshold)
-            scores.append((pos, score))
+        scores = score_all_pairs(current_sequence, job_totals, bn_proc, bn_threshold)
 
-        # Sort by score descending; tie-break by position to keep determinism
-        scores.sort(key=lambda x: (-x[1], x[0]))
-        top_pairs = [pos for pos, _ in scores[:top_k]]
+        # Rank by score descending; tie-break by position to keep determinism
+        top_pairs = select_top_pairs(scores, top_k, top_pairs_buf)
 
         # Intensification: keep applying best-improvement swaps within this iteration
+        # The budget was just checked above, so the first re-check is due
+        # _BUDGET_CHECK_INTERVAL steps from now
+        inner_steps = 1
         while True:
-            # Re-evaluate time budget
-            if time_budget_seconds is not None and (time.perf_counter() - start_time) >= time_budget_seconds:
+            # Re-evaluate time budget every few steps
+            if (time_budget_seconds is not None and inner_steps % _BUDGET_CHECK_INTERVAL == 0
+                    and (time.perf_counter() - start_time) >= time_budget_seconds):
                 break
-            best_pos = None
-            best_new_makespan = current_makespan
-            best_new_ct = None
-            if search_mode == "first":
-                for pos in top_pairs:
-                    new_makespan, new_ct = calculate_makespan_delta(
-                        processing_times, current_sequence, pos, completion_times
-                    )
-                    if new_makespan < current_makespan:
-                        best_pos = pos
-                        best_new_makespan = new_makespan
-                        best_new_ct = new_ct
-                        break
-            else:
-                for pos in top_pairs:
-                    new_makespan, new_ct = calculate_makespan_delta(
-                        processing_times, current_sequence, pos, completion_times
-                    )
-                    if new_makespan < best_new_makespan:
-                        best_new_makespan = new_makespan
-                        best_pos = pos
-                        best_new_ct = new_ct
+            inner_steps += 1
+            best_pos, best_new_makespan, best_new_ct = scan(
+                processing_times, current_sequence, completion_times, top_pairs, current_makespan, executor
+            )
             if best_pos is not None and best_new_makespan < current_makespan:
-                new_sequence = swap_adjacent(current_sequence, best_pos)
                 if verbose:
                     print(f"Improved: {current_makespan} -> {best_new_makespan} by swapping {best_pos} and {best_pos+1}")
-                current_sequence = new_sequence
+                current_sequence[best_pos:best_pos + 2] = current_sequence[best_pos + 1], current_sequence[best_pos]
+                # Both scans return the makespan and matrix of the recurrence
                 current_makespan = best_new_makespan
+                completion_times = best_new_ct
                 if current_makespan < best_makespan:
                     best_makespan = current_makespan
                     best_sequence = current_sequence.copy()
-                completion_times = best_new_ct if best_new_ct is not None else calculate_completion_times(processing_times, current_sequence)
                 improvement_found = True
-                if recompute_bottleneck:
-                    bottleneck_machine = identify_bottleneck_machine(processing_times)
-                # Optionally recompute bottleneck stats when it changes
-                if recompute_bottleneck:
-                    bn_proc = [processing_times[j][bottleneck_machine] for j in range(num_jobs)]
-                    sorted_bn = sorted(bn_proc)
-                    q_index = max(0, min(len(sorted_bn) - 1, int(0.8 * (len(sorted_bn) - 1))))
-                    bn_threshold = sorted_bn[q_index]
-                # Rescore neighbors since sequence changed
-                scores = []
-                for pos in range(len(current_sequence) - 1):
-                    score = score_adjacent_pair(current_sequence, pos, processing_times, bottleneck_machine, job_totals, len(current_sequence), bn_proc, bn_threshold)
-                    scores.append((pos, score))
-                scores.sort(key=lambda x: (-x[1], x[0]))
-                top_pairs = [pos for pos, _ in scores[:top_k]]
+                # Rescore the pairs around the swap and re-rank
+                rescore_after_swap(scores, current_sequence, best_pos, job_totals, bn_proc, bn_threshold)
+                top_pairs = select_top_pairs(scores, top_k, top_pairs_buf)
                 continue
             break
 
@@ -308,21 +462,24 @@ def local_search_main(initial_sequence: List[int],
             no_improvement_streak += 1
             # Last-resort guided perturbation: apply the single best-scored swap even if non-improving
             if no_improvement_streak >= 2:
-                best_pos = scores[0][0] if scores else None
+                best_pos = int(np.argmax(scores)) if scores.size else None
                 if best_pos is not None:
-                    # Apply guided perturbation with delta update
+                    # Apply guided perturbation with delta update, priced into
+                    # a spare matrix so a rejected move allocates nothing
+                    if spare_ct is None:
+                        spare_ct = [row[:] for row in completion_times]
                     pert_mk, pert_ct = calculate_makespan_delta(
-                        processing_times, current_sequence, best_pos, completion_times
+                        processing_times, current_sequence, best_pos, completion_times, out=spare_ct
                     )
                     # Guardrail: do not allow large degradation (>0.2%)
                     max_worsen = 0.002 * current_makespan
                     if pert_mk <= current_makespan + max_worsen:
-                        pert_seq = swap_adjacent(current_sequence, best_pos)
                         if verbose:
                             print(f"Guided perturbation at pos {best_pos}: {current_makespan} -> {pert_mk}")
-                        current_sequence = pert_seq
+                        current_sequence[best_pos:best_pos + 2] = current_sequence[best_pos + 1], current_sequence[best_pos]
                         current_makespan = pert_mk
-                        completion_times = pert_ct
+                        # The old matrix becomes the spare for the next perturbation
+                        completion_times, spare_ct = pert_ct, completion_times
                         no_improvement_streak = 0
                         # Track best if accidentally improved
                         if current_makespan < best_makespan:
@@ -344,16 +501,25 @@ def local_search_main(initial_sequence: List[int],
         # Limited-range insertion phase (delta-based, larger but still adjacent-derived moves)
         if not improvement_found and no_improvement_streak >= 2:
             insertion_improvement = False
-            n = len(current_sequence)
             # Consider only top few positions to bound work
-            candidate_positions = top_pairs[:min(10, len(top_pairs))]
+            candidate_positions = top_pairs[:min(10, len(top_pairs))].tolist()
+            # Head table of the current sequence, shared by every candidate below
+            heads = calculate_head_table(processing_times, current_sequence)
+            # Taillard prices only preselect moves; the recurrence decides
+            tol = price_tolerance(current_makespan)
             # For each candidate, try moving within a window of size W
             W = 14
             for pos in candidate_positions:
                 left = max(0, pos - W)
                 right = min(n - 1, pos + W)
+                # Evaluate every insertion point of the job at pos in one Taillard pass
+                move_makespans = calculate_move_makespans(processing_times, current_sequence, pos, heads)
                 # Try moving job at pos to targets within [left, right]
                 for insert_pos in list(range(left, pos)) + list(range(pos + 1, right + 1)):
+                    if move_makespans[insert_pos] >= current_makespan + tol:
+                        continue
+                    # Confirm the move on its recurrence makespan, so rounding
+                    # in the price can neither accept a tie nor miss a gain
                     new_seq, new_mk, new_ct = evaluate_insertion_delta(
                         processing_times, current_sequence, pos, insert_pos, completion_times
                     )
@@ -377,39 +543,129 @@ def local_search_main(initial_sequence: List[int],
         # Windowed re-optimization around the most critical region
         if improvement_found:
             # Re-score and focus on top-1 region
-            scores = []
-            for pos in range(len(current_sequence) - 1):
-                score = score_adjacent_pair(current_sequence, pos, processing_times, bottleneck_machine, job_totals, len(current_sequence), bn_proc, bn_threshold)
-                scores.append((pos, score))
-            scores.sort(key=lambda x: (-x[1], x[0]))
-            focus_pos = scores[0][0]
-            n = len(current_sequence)
+            scores = score_all_pairs(current_sequence, job_totals, bn_proc, bn_threshold)
+            focus_pos = int(np.argmax(scores))
             W = 18
             L = max(0, focus_pos - W)
             R = min(n - 2, focus_pos + W)
-            # Intensify within [L, R]
+            # Intensify within [L, R]: sweep left to right, applying every improving
+            # swap and resuming the sweep just after it
             while True:
                 improved_window = False
-                for pos in range(L, R + 1):
-                    new_mk, new_ct = calculate_makespan_delta(processing_times, current_sequence, pos, completion_times)
-                    if new_mk < current_makespan:
-                        current_sequence = swap_adjacent(current_sequence, pos)
-                        current_makespan = new_mk
-                        completion_times = new_ct
-                        improved_window = True
-                        if current_makespan < best_makespan:
-                            best_makespan = current_makespan
-                            best_sequence = current_sequence.copy()
-                        if recompute_bottleneck:
-                            bottleneck_machine = identify_bottleneck_machine(processing_times)
+                start = L
+                while start <= R:
+                    pos, new_mk, new_ct = find_first_improving_swap(
+                        processing_times, current_sequence, completion_times, range(start, R + 1), current_makespan,
+                        executor
+                    )
+                    if pos is None:
+                        break
+                    current_sequence[pos:pos + 2] = current_sequence[pos + 1], current_sequence[pos]
+                    current_makespan = new_mk
+                    completion_times = new_ct
+                    improved_window = True
+                    if current_makespan < best_makespan:
+                        best_makespan = current_makespan
+                        best_sequence = current_sequence.copy()
+                    start = pos + 1
                 if not improved_window:
                     break
 
     # Calculate total search time
     search_time = time.perf_counter() - start_time
+    if executor is not None:
+        executor.shutdown()
     
     # Always return the best solution found (robust to non-improving perturbations)
-    return best_sequence, best_makespan, iterations_used, search_time
+    return best_sequence.tolist(), best_makespan, iterations_used, search_time
+
+def perturb_sequence(sequence: List[int], num_swaps: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Apply num_swaps random adjacent swaps to a copy of sequence.
+
+    Args:
+        sequence: Job sequence to start from
+        num_swaps: Number of adjacent swaps to apply
+        seed: Seed for the random swap positions (reproducible)
+
+    Returns:
+        Perturbed sequence as an int32 array
+    """
+    seq = np.array(sequence, dtype=np.int32)
+    if seq.shape[0] < 2:
+        return seq
+    rng = np.random.default_rng(seed)
+    for pos in rng.integers(0, seq.shape[0] - 1, size=num_swaps).tolist():
+        seq[pos:pos + 2] = seq[pos + 1], seq[pos]
+    return seq
+
+# Per-process matrix and search settings for multi_walk_local_search, set once by the initializer
+_walk_processing_times: Optional[np.ndarray] = None
+_walk_options: dict = {}
+
+def _init_walk_worker(processing_times: np.ndarray, options: dict) -> None:
+    global _walk_processing_times, _walk_options
+    _walk_processing_times = processing_times
+    _walk_options = options
+
+def _walk_task(start: np.ndarray) -> Tuple[List[int], float, int, float]:
+    return local_search_main(start, _walk_processing_times, **_walk_options)
+
+def multi_walk_local_search(initial_sequence: List[int],
+                            processing_times: List[List[float]],
+                            num_walks: int,
+                            perturbation_swaps: Optional[int] = None,
+                            seed: int = 0,
+                            max_workers: Optional[int] = None,
+                            **search_options) -> Tuple[List[int], float, int, float]:
+    """
+    Run independent local searches from several starts in parallel processes.
+
+    Walk 0 starts from initial_sequence itself; walk w > 0 starts from it
+    after perturbation_swaps random adjacent swaps seeded with seed + w. The
+    walks share nothing, so each runs local_search_main in its own process;
+    the matrix and options reach every worker once through the pool
+    initializer. Workers are spawned, so a calling script needs the usual
+    if __name__ == '__main__' guard.
+
+    Args:
+        initial_sequence: Initial sequence from a constructive heuristic
+        processing_times: Processing times matrix
+        num_walks: Number of independent searches
+        perturbation_swaps: Adjacent swaps per perturbed start (default n // 10, at least 1)
+        seed: Base seed of the perturbations
+        max_workers: Number of worker processes (default: one per CPU, at most num_walks)
+        **search_options: Keyword arguments passed on to local_search_main
+
+    Returns:
+        Result of the walk with the lowest makespan (the earliest walk on ties),
+        in the same form as local_search_main
+    """
+    if num_walks <= 1:
+        return local_search_main(initial_sequence, processing_times, **search_options)
+    P = np.ascontiguousarray(processing_times)
+    n = len(initial_sequence)
+    if perturbation_swaps is None:
+        perturbation_swaps = max(1, n // 10)
+    starts = [np.array(initial_sequence, dtype=np.int32)]
+    starts += [perturb_sequence(initial_sequence, perturbation_swaps, seed + w) for w in range(1, num_walks)]
+
+    # The per-job totals are the same for every walk, so they are computed
+    # here once and shipped with the options instead of once per walk
+    if search_options.get('job_totals') is None:
+        search_options['job_totals'] = compute_job_totals(P)
+
+    if max_workers is None:
+        max_workers = min(num_walks, os.cpu_count() or 1)
+    # Workers are spawned, not forked: a child forked after Numba's parallel
+    # kernels have started their thread pool can deadlock
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_walk_worker,
+                             initargs=(P, search_options)) as executor:
+        results = list(executor.map(_walk_task, starts))
+    # min keeps the first of equal makespans, i.e. the lowest walk index
+    return min(results, key=lambda result: result[1])
 
 # Add this at the end to avoid circular imports
-from makespan import calculate_makespan, calculate_completion_times, calculate_makespan_delta
\ No newline at end of file
+from makespan import calculate_makespan, calculate_completion_times, calculate_makespan_delta, update_completion_times, find_best_improving_swap, find_first_improving_swap, calculate_move_makespans, calculate_head_table, matrix_shape, price_tolerance
\ No newline at end of file
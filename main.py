@@ -10,44 +10,78 @@ Usage:
 Where <input_file> can be a .csv file or a Taillard .txt/.fsp file.
 """
 
-import sys
 import os
-from typing import List, Optional, Dict, Any
+import sys
+from typing import List, Optional, Dict, Any, Union
+import numpy as np
 
 # Import our modules
 from io_utils import read_instance, validate_processing_times, print_data_summary
-from makespan import calculate_makespan, print_sequence_analysis
-from heuristics import pendulum_heuristic, randomized_constructive_heuristic
-from local_search import local_search_main
+from makespan import calculate_makespan, compare_sequences, print_sequence_analysis, warm_up_kernels
+from heuristics import (pendulum_heuristic, randomized_constructive_heuristic, prepare_instance,
+                        multi_start_construction)
+from local_search import multi_walk_local_search
+
+def _randomized_start(instance, method: str, param, num_starts: int) -> np.ndarray:
+    """Best of num_starts randomized constructions, seeded 42, 43, ..."""
+    if num_starts <= 1:
+        return randomized_constructive_heuristic(instance, method=method, param=param, seed=42)
+    candidates = multi_start_construction(instance, num_starts, method, param, first_seed=42)
+    # Ties keep seed order, so the choice is deterministic
+    best_idx, _ = compare_sequences(instance.P, candidates)[0]
+    return candidates[best_idx]
 
-def solve_flow_shop(file_path: str) -> Optional[Dict[str, Any]]:
+
+def solve_flow_shop(source: Union[str, os.PathLike, np.ndarray],
+                    job_names: Optional[List[str]] = None,
+                    num_walks: int = 1,
+                    num_starts: int = 1) -> Optional[Dict[str, Any]]:
     """
     Solve the Flow Shop Scheduling Problem using the Pendulum heuristic.
     
     Args:
-        file_path: Path to input file (.csv or Taillard .txt/.fsp)
+        source: Path to input file (.csv or Taillard .txt/.fsp; str or path-like), or an
+            in-memory (num_jobs, num_machines) processing time matrix, which
+            skips the file round-trip entirely
+        job_names: Job names for an in-memory matrix (default Job_1, Job_2, ...);
+            ignored when reading from a file
+        num_walks: Number of independent local searches run in parallel
+            processes from perturbed copies of the initial solution; the best
+            one is kept (1 runs a single search in this process)
+        num_starts: Number of randomized constructions (alpha or k-best) run
+            in parallel processes with seeds 42, 43, ...; the one with the
+            smallest makespan seeds the local search (1 runs a single
+            construction in this process)
         
     Returns:
         Dictionary with solution details or None if an error occurred
     """
     try:
         # Read and validate input data
-        print("=" * 60)
-        print("FLOW SHOP SCHEDULING SOLVER (Pendulum Heuristic)")
-        print("=" * 60)
-        print(f"Reading data from: {file_path}")
-        
-        processing_times, job_names = read_instance(file_path)
+        banner = "=" * 60
+        sys.stdout.write(f"{banner}\nFLOW SHOP SCHEDULING SOLVER (Pendulum Heuristic)\n{banner}\n")
+        if isinstance(source, (str, os.PathLike)):
+            print(f"Reading data from: {source}")
+            processing_times, job_names = read_instance(source)
+        else:
+            processing_times = np.ascontiguousarray(source, dtype=np.float64)
+            if job_names is None:
+                job_names = [f"Job_{i+1}" for i in range(processing_times.shape[0])]
         validate_processing_times(processing_times)
         
+        # Job totals and first-machine times are shared by the constructive
+        # heuristic and the local search; the grand total feeds the summary
+        instance = prepare_instance(processing_times)
+        job_totals = instance.totals
+
         # Print data summary
-        print_data_summary(processing_times, job_names)
+        print_data_summary(processing_times, job_names, instance.total_processing)
         
         # Get initial solution using user-selected heuristic
-        print("\n--- Select Heuristic Method ---")
-        print("a: Alpha randomization")
-        print("k: K-best randomization") 
-        print("n: None (use standard pendulum heuristic)")
+        sys.stdout.write("\n--- Select Heuristic Method ---\n"
+                         "a: Alpha randomization\n"
+                         "k: K-best randomization\n"
+                         "n: None (use standard pendulum heuristic)\n")
         
         while True:
             choice = input("Enter your choice (a/k/n): ").lower().strip()
@@ -66,12 +100,7 @@ def solve_flow_shop(file_path: str) -> Optional[Dict[str, Any]]:
                 except ValueError:
                     print("Please enter a valid number")
             
-            initial_sequence = randomized_constructive_heuristic(
-                processing_times, 
-                method='alpha', 
-                param=alpha,
-                seed=42
-            )
+            initial_sequence = _randomized_start(instance, 'alpha', alpha, num_starts)
             print(f"Using alpha randomization with param={alpha}")
             
         elif choice == 'k':
@@ -85,51 +114,51 @@ def solve_flow_shop(file_path: str) -> Optional[Dict[str, Any]]:
                 except ValueError:
                     print("Please enter a valid integer")
             
-            initial_sequence = randomized_constructive_heuristic(
-                processing_times, 
-                method='kbest', 
-                param=k,
-                seed=42
-            )
+            initial_sequence = _randomized_start(instance, 'kbest', k, num_starts)
             print(f"Using k-best randomization with param={k}")
             
         else:  # choice == 'n'
-            initial_sequence = pendulum_heuristic(processing_times)
+            initial_sequence = pendulum_heuristic(instance)
             print("Using standard pendulum heuristic")
         initial_makespan = calculate_makespan(processing_times, initial_sequence)
         
         # Print initial solution
-        print("\n--- Initial Solution ---")
-        print(f"Makespan: {initial_makespan}")
-        print_sequence_analysis(processing_times, initial_sequence, job_names)
+        sys.stdout.write(f"\n--- Initial Solution ---\nMakespan: {initial_makespan}\n")
+        print_sequence_analysis(processing_times, initial_sequence, job_names,
+                                {'makespan': initial_makespan})
         
         # Run local search to improve the solution
         print("\n--- Local Search Phase ---")
         try:
-            improved_sequence, improved_makespan, iters_used, search_time = local_search_main(
-                initial_sequence=initial_sequence,
-                processing_times=processing_times,
+            improved_sequence, improved_makespan, iters_used, search_time = multi_walk_local_search(
+                initial_sequence,
+                processing_times,
+                num_walks=num_walks,
+                seed=42,
                 max_iterations=1000,
                 top_k=None,
                 search_mode="best",
                 recompute_bottleneck=True,
                 time_budget_seconds=None,
-                verbose=False
+                verbose=False,
+                job_totals=job_totals
             )
             
-            # Print results
-            print("\n--- Results ---")
-            print(f"Initial makespan: {initial_makespan}")
-            print(f"Improved makespan: {improved_makespan}")
+            # Print results (collected and written in one go)
+            parts = ["\n--- Results ---\n",
+                     f"Initial makespan: {initial_makespan}\n",
+                     f"Improved makespan: {improved_makespan}\n"]
             if initial_makespan > 0:  # Avoid division by zero
                 improvement = ((initial_makespan - improved_makespan) / initial_makespan) * 100
-                print(f"Improvement: {initial_makespan - improved_makespan:.2f} ({improvement:.2f}%)")
-            print(f"Iterations used: {iters_used}")
-            print(f"Local search time: {search_time:.4f} seconds")
+                parts.append(f"Improvement: {initial_makespan - improved_makespan:.2f} ({improvement:.2f}%)\n")
+            parts.append(f"Iterations used: {iters_used}\n")
+            parts.append(f"Local search time: {search_time:.4f} seconds\n")
             
             # Print detailed analysis of improved solution
-            print("\n--- Improved Solution ---")
-            print_sequence_analysis(processing_times, improved_sequence, job_names)
+            parts.append("\n--- Improved Solution ---\n")
+            sys.stdout.write(''.join(parts))
+            print_sequence_analysis(processing_times, improved_sequence, job_names,
+                                    {'makespan': improved_makespan})
             
             return {
                 'sequence': improved_sequence,
@@ -175,13 +204,12 @@ def main():
         sys.exit(1)
     
     file_path = sys.argv[1]
+
+    # Compile (or load) the makespan kernel before the first evaluation
+    warm_up_kernels()
     
-    # Check if file exists
-    if not os.path.exists(file_path):
-        print(f"Error: File not found: {file_path}")
-        sys.exit(1)
-    
-    # Solve the problem
+    # Solve the problem; a missing file surfaces as the reader's
+    # FileNotFoundError, reported by solve_flow_shop
     result = solve_flow_shop(file_path)
     
     if result is None:
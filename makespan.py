@@ -5,10 +5,183 @@ This module provides functions to calculate and analyze the makespan (total comp
 for a given sequence of jobs in a flow shop environment.
 """
 
-from typing import List, Tuple, Dict, Any
+import os
+import sys
+import threading
+from concurrent.futures import Executor, wait
+from functools import lru_cache
+from itertools import accumulate, chain, islice
+from typing import Callable, List, Optional, Tuple, Union, Dict, Any
+import numpy as np
+from jit_utils import njit, prange, NUMBA_AVAILABLE
 
+# Optional ahead-of-time Cython build of the makespan recurrence (see
+# _construct.pyx), used only when Numba is not available
+try:
+    from _construct import makespan as _makespan_c
+except ImportError:
+    _makespan_c = None
 
-def calculate_makespan(processing_times: List[List[float]], sequence: List[int]) -> float:
+# Matrices with fewer cells than this are evaluated in plain Python: for tiny
+# instances the JIT dispatch (and first-call compile/cache load) costs more
+# than the whole recurrence.
+_JIT_MIN_CELLS = 64
+
+# Minimum scan work (positions x matrix cells) before find_first_improving_swap
+# spreads a scan over a thread pool; below it, dispatch costs more than it saves
+_PARALLEL_MIN_WORK = 200_000
+
+# Per-thread scratch matrices for the swap-scan kernels (see _scratch_buffers)
+_scratch = threading.local()
+
+# Machine tile width of the blocked makespan recurrence; instances with more
+# than two tiles of machines are swept one tile at a time, which about halves
+# the time per cell from roughly fifty machines up
+_MACHINE_TILE = 16
+
+# Verbosity of the reporting helpers; 0 turns print_sequence_analysis into a
+# no-op (e.g. while logging from inside a search loop)
+LOG_LEVEL = 1
+
+# Relative bound on the rounding difference between a Taillard head/tail price
+# and the makespan of the completion recurrence (the same sums in another order)
+_PRICE_RTOL = 1e-9
+
+
+def _as_array(processing_times) -> np.ndarray:
+    """Return processing_times as a C-contiguous ndarray for the numeric kernels."""
+    if isinstance(processing_times, np.ndarray):
+        return np.ascontiguousarray(processing_times)
+    return np.ascontiguousarray(processing_times, dtype=np.float64)
+
+
+def _as_index_array(sequence) -> np.ndarray:
+    """
+    Return sequence as a contiguous integer array for the numeric kernels.
+
+    Integer ndarrays (such as the int32 buffers used by the heuristics and the
+    local search) are passed through without a conversion copy.
+    """
+    if isinstance(sequence, np.ndarray) and sequence.dtype.kind in 'iu':
+        return np.ascontiguousarray(sequence)
+    return np.ascontiguousarray(sequence, dtype=np.int64)
+
+
+def price_tolerance(makespan: float) -> float:
+    """
+    Margin by which a Taillard price may miss the recurrence makespan.
+
+    Head/tail prices (calculate_swap_makespans, calculate_move_makespans,
+    delta_insert) add the same processing times as the recurrence but in a
+    different order, so on fractional data they can differ in the last bits.
+    Searches use prices within this margin of the incumbent only to pick
+    candidates, and accept a move on its recurrence makespan.
+    """
+    return _PRICE_RTOL * max(1.0, abs(makespan))
+
+
+def _scratch_buffers(shape: Tuple[int, int], count: int,
+                     pool: str = 'scan') -> List[np.ndarray]:
+    """
+    Return count reusable float64 matrices of the given shape for this thread.
+
+    Each thread keeps its own buffers, so concurrent searches never share
+    one. Contents are overwritten by the next call: callers must copy out
+    anything they keep. Callers that need buffers at the same time (of
+    different shapes) use different pool names, so they do not evict each
+    other's buffers.
+    """
+    pools = getattr(_scratch, 'pools', None)
+    if pools is None:
+        pools = _scratch.pools = {}
+    bufs = pools.get(pool)
+    if bufs is None or bufs[0].shape != shape:
+        bufs = []
+    while len(bufs) < count:
+        bufs.append(np.empty(shape))
+    pools[pool] = bufs
+    return bufs[:count]
+
+
+def matrix_shape(processing_times) -> Tuple[int, int]:
+    """
+    Return (num_jobs, num_machines) for an ndarray or a list of lists.
+
+    ndarrays answer with a single .shape lookup instead of indexing a row.
+    """
+    if isinstance(processing_times, np.ndarray):
+        return processing_times.shape[0], processing_times.shape[1]
+    num_jobs = len(processing_times)
+    return num_jobs, (len(processing_times[0]) if num_jobs > 0 else 0)
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _makespan_kernel(P, sequence):
+    # Rolling 1-D completion row: row[k] holds the completion time of the
+    # latest scheduled job on machine k, so only O(m) memory is touched.
+    # The max is written as a conditional expression, which LLVM lowers to a
+    # branch-free select (and which is also the fastest spelling in CPython
+    # when Numba is unavailable).
+    m = P.shape[1]
+    n = sequence.shape[0]
+    if m <= 2 * _MACHINE_TILE:
+        row = np.zeros(m)
+        for i in range(n):
+            job = P[sequence[i]]
+            left = 0.0
+            for k in range(m):
+                up = row[k]
+                left = (up if up > left else left) + job[k]
+                row[k] = left
+        return row[m - 1]
+
+    # Many machines: sweep every job through one tile of machines at a time.
+    # edge[i] carries the completion time of job i on the last machine of the
+    # previous tile (the `left` input of the next one), and the tile's short
+    # row stays in registers/L1 for the whole sweep.
+    edge = np.zeros(n)
+    row = np.zeros(_MACHINE_TILE)
+    for start in range(0, m, _MACHINE_TILE):
+        width = min(_MACHINE_TILE, m - start)
+        for k in range(width):
+            row[k] = 0.0
+        for i in range(n):
+            job = P[sequence[i]]
+            left = edge[i]
+            for k in range(width):
+                up = row[k]
+                left = (up if up > left else left) + job[start + k]
+                row[k] = left
+            edge[i] = left
+    return edge[n - 1] if n > 0 else 0.0
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def _makespan_many_kernel(P, sequences, out):
+    # Candidates are independent, so they are spread across threads
+    for s in prange(sequences.shape[0]):
+        out[s] = _makespan_kernel(P, sequences[s])
+    return out
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile (or load from the Numba cache) the makespan kernel ahead of time.
+
+    Runs the kernel once on a 2x2 dummy for the two common input layouts, the
+    float32/int32 arrays of Taillard files and heuristics and the float64/int64
+    defaults, so the first real call does not pay the compile latency. Does
+    nothing when Numba is unavailable. Not run at import: entry points that
+    are about to evaluate sequences (such as main.main) call it.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    for p_dtype, s_dtype in ((np.float64, np.int64), (np.float32, np.int32)):
+        _makespan_kernel(np.ones((2, 2), dtype=p_dtype), np.arange(2, dtype=s_dtype))
+
+
+def calculate_makespan(processing_times: List[List[float]], sequence: List[int],
+                       validate: bool = True) -> float:
     """
     Calculate the makespan for a given job sequence in a flow shop.
     
@@ -19,6 +192,10 @@ def calculate_makespan(processing_times: List[List[float]], sequence: List[int])
         processing_times: Matrix where processing_times[i][j] represents
                          the processing time of job i on machine j
         sequence: Sequence of job indices (0-based)
+        validate: Check the job indices first. Internal callers whose
+                  sequences are permutations built from an already checked
+                  one pass False to skip the O(n) scan; the compiled kernel
+                  does not bounds-check, so only do so for trusted sequences.
         
     Returns:
         The makespan (total completion time)
@@ -26,85 +203,401 @@ def calculate_makespan(processing_times: List[List[float]], sequence: List[int])
     Raises:
         ValueError: If sequence contains invalid job indices
     """
-    if not processing_times or not sequence:
+    if len(processing_times) == 0 or len(sequence) == 0:
         return 0.0
         
-    num_jobs = len(processing_times)
-    num_machines = len(processing_times[0]) if num_jobs > 0 else 0
+    num_jobs, num_machines = matrix_shape(processing_times)
     
-    # Validate sequence
-    for job_idx in sequence:
-        if job_idx < 0 or job_idx >= num_jobs:
-            raise ValueError(f"Invalid job index {job_idx}. Must be between 0 and {num_jobs-1}")
-    
-    # Initialize completion time matrix
-    completion_times = [[0.0 for _ in range(num_machines)] for _ in range(len(sequence))]
+    # Validate sequence (index arrays are checked in one vectorized pass)
+    if validate:
+        if isinstance(sequence, np.ndarray):
+            bad = np.flatnonzero((sequence < 0) | (sequence >= num_jobs))
+            if bad.size:
+                raise ValueError(f"Invalid job index {sequence[bad[0]]}. Must be between 0 and {num_jobs-1}")
+        else:
+            for job_idx in sequence:
+                if job_idx < 0 or job_idx >= num_jobs:
+                    raise ValueError(f"Invalid job index {job_idx}. Must be between 0 and {num_jobs-1}")
+
+    if num_machines == 0:
+        return 0.0
+
+    # Degenerate shapes need no recurrence: with one machine, or one job in
+    # the sequence, the makespan is a plain running sum (accumulated in
+    # order, so it matches the recurrence to the last bit)
+    if num_machines == 1 or len(sequence) == 1:
+        if isinstance(processing_times, np.ndarray):
+            times = (processing_times[sequence, 0] if num_machines == 1
+                     else processing_times[sequence[0]])
+            return float(np.cumsum(times, dtype=np.float64)[-1])
+        total = 0.0
+        if num_machines == 1:
+            for job_idx in sequence:
+                total += processing_times[job_idx][0]
+        else:
+            for proc_time in processing_times[sequence[0]]:
+                total += proc_time
+        return total
+
+    # Large matrices go through the compiled rolling-row kernel; small ones
+    # use the list path below. Nested lists are converted first: the one C
+    # level copy plus the kernel still takes about half the time of the
+    # interpreted loop. Without Numba, the prebuilt Cython kernel (no JIT
+    # cost, so no size threshold) takes float ndarrays of any size.
+    if NUMBA_AVAILABLE and num_jobs * num_machines >= _JIT_MIN_CELLS:
+        seq = _as_index_array(sequence)
+        return float(_makespan_kernel(_as_array(processing_times), seq))
+    if isinstance(processing_times, np.ndarray):
+        if (_makespan_c is not None and not NUMBA_AVAILABLE
+                and processing_times.dtype in (np.float32, np.float64)):
+            seq = _as_index_array(sequence)
+            if seq.dtype in (np.int32, np.int64):
+                return float(_makespan_c(np.ascontiguousarray(processing_times), seq))
+        processing_times = processing_times.tolist()
+    if isinstance(sequence, np.ndarray):
+        sequence = sequence.tolist()
     
-    # Calculate completion times for each job in the sequence
-    for seq_pos, job_idx in enumerate(sequence):
+    # Rolling completion row, as in _makespan_kernel: row[machine] holds the
+    # completion time of the latest scheduled job on that machine, so the
+    # recurrence max(C[i-1][j], C[i][j-1]) + p only ever needs O(m) floats
+    row = [0.0] * num_machines
+    for job_idx in sequence:
+        job_times = processing_times[job_idx]
+        left = 0.0
         for machine in range(num_machines):
-            proc_time = processing_times[job_idx][machine]
-            
-            if seq_pos == 0 and machine == 0:
-                completion_times[seq_pos][machine] = proc_time
-            elif seq_pos == 0:
-                completion_times[seq_pos][machine] = (
-                    completion_times[seq_pos][machine - 1] + proc_time
-                )
-            elif machine == 0:
-                completion_times[seq_pos][machine] = (
-                    completion_times[seq_pos - 1][machine] + proc_time
-                )
-            else:
-                completion_times[seq_pos][machine] = (
-                    max(completion_times[seq_pos - 1][machine],
-                        completion_times[seq_pos][machine - 1]) + proc_time
-                )
+            up = row[machine]
+            left = (up if up > left else left) + job_times[machine]
+            row[machine] = left
     
     # Makespan is the completion time of the last job on the last machine
-    return completion_times[-1][-1] if completion_times else 0.0
+    return row[-1]
+
+
+def calculate_makespan_many(processing_times: List[List[float]],
+                            sequences: np.ndarray) -> np.ndarray:
+    """
+    Calculate the makespans of a batch of sequences in one call.
+
+    Intended for neighborhood scans: build one row per candidate move and
+    evaluate them together, which amortizes the Python/JIT boundary over the
+    whole batch and lets Numba run the candidates in parallel. Without Numba
+    the recurrence is vectorized across the candidates instead, one NumPy
+    operation per (position, machine) cell for the whole batch. Job indices are
+    not validated here.
+
+    Args:
+        processing_times: Matrix of processing times
+        sequences: (num_candidates, num_jobs) array of job indices
+
+    Returns:
+        Array with the makespan of every candidate sequence
+    """
+    P = _as_array(processing_times)
+    seqs = np.ascontiguousarray(sequences, dtype=np.int64)
+    out = np.zeros(seqs.shape[0])
+    if seqs.ndim != 2 or seqs.shape[1] == 0 or P.shape[1] == 0:
+        return out
+    if NUMBA_AVAILABLE:
+        return _makespan_many_kernel(P, seqs, out)
+
+    # Machine-major rolling rows: rows[k] holds machine k's completion time
+    # for every candidate, so each update is one contiguous vector operation
+    rows = np.zeros((P.shape[1], seqs.shape[0]))
+    for i in range(seqs.shape[1]):
+        job_times = P[seqs[:, i]].T
+        left = np.zeros(seqs.shape[0])
+        for k in range(P.shape[1]):
+            left = np.maximum(rows[k], left)
+            left += job_times[k]
+            rows[k] = left
+    out[:] = rows[-1]
+    return out
+
+
+def compare_sequences(processing_times: List[List[float]],
+                      sequences: List[List[int]]) -> List[Tuple[int, float]]:
+    """
+    Rank several candidate sequences (e.g. multi-start constructions) by makespan.
+
+    Sequences of equal length are stacked into one (S, n) index array and
+    evaluated in a single calculate_makespan_many call (parallel across
+    candidates with Numba) instead of one calculate_makespan call each;
+    sequences of different lengths are batched per length.
+
+    Args:
+        processing_times: Matrix of processing times
+        sequences: Candidate job sequences
+
+    Returns:
+        (index into sequences, makespan) pairs, best first; ties keep the
+        input order
+
+    Raises:
+        ValueError: If a sequence contains invalid job indices
+    """
+    if len(sequences) == 0:
+        return []
+    P = _as_array(processing_times)
+    num_jobs = P.shape[0]
+    makespans = np.zeros(len(sequences))
+
+    groups = {}
+    for idx, seq in enumerate(sequences):
+        groups.setdefault(len(seq), []).append(idx)
+    for length, members in groups.items():
+        if length == 0:
+            continue
+        batch = np.array([np.asarray(sequences[i]) for i in members], dtype=np.int64)
+        bad = (batch < 0) | (batch >= num_jobs)
+        if bad.any():
+            row, col = np.argwhere(bad)[0]
+            raise ValueError(f"Invalid job index {batch[row, col]}. Must be between 0 and {num_jobs-1}")
+        makespans[members] = calculate_makespan_many(P, batch)
+
+    order = np.argsort(makespans, kind='stable')
+    return [(int(i), float(makespans[i])) for i in order]
+
+
+def cached_makespan_evaluator(processing_times: List[List[float]],
+                              maxsize: Optional[int] = 200_000) -> Callable[[List[int]], float]:
+    """
+    Build a memoized calculate_makespan for one instance.
+
+    Searches that revisit the same sequences (plateaus, cycles, repeated
+    restarts) pay a dictionary lookup instead of the O(nm) recurrence for every
+    repeat. The evaluator works on its own read-only snapshot of the matrix, so
+    later changes to processing_times cannot make cached values stale; build a
+    new evaluator per instance instead of clearing one.
+
+    Args:
+        processing_times: Matrix of processing times
+        maxsize: Maximum number of cached sequences (None for unbounded)
+
+    Returns:
+        Callable mapping a job sequence to its makespan; like an lru_cache
+        function it has cache_info() and cache_clear()
+    """
+    P = np.array(_as_array(processing_times))
+    P.setflags(write=False)
+
+    # Sequences are keyed by their raw int32 bytes, which hash much faster
+    # than a tuple of Python ints
+    @lru_cache(maxsize=maxsize)
+    def _cached(key: bytes) -> float:
+        return calculate_makespan(P, np.frombuffer(key, dtype=np.int32))
+
+    def evaluate(sequence: List[int]) -> float:
+        return _cached(np.asarray(sequence, dtype=np.int32).tobytes())
+
+    evaluate.cache_info = _cached.cache_info
+    evaluate.cache_clear = _cached.cache_clear
+    return evaluate
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def _swap_makespans_kernel(P, sequence, heads, tails, positions, out):
+    # Taillard-style swap evaluation: with e (heads) and q (tails) of the
+    # current sequence, swapping pos and pos+1 only changes the two rows in
+    # between, so each candidate costs O(m): f1/f2 are the completion times of
+    # the swapped pair and the makespan is max_j (f2[j] + q[pos + 2, j])
+    m = P.shape[1]
+    for idx in prange(positions.shape[0]):
+        pos = positions[idx]
+        first = P[sequence[pos + 1]]
+        second = P[sequence[pos]]
+        f1 = 0.0
+        f2 = 0.0
+        best = 0.0
+        for j in range(m):
+            up = heads[pos, j]
+            f1 = (up if up > f1 else f1) + first[j]
+            f2 = (f1 if f1 > f2 else f2) + second[j]
+            total = f2 + tails[pos + 2, j]
+            best = total if total > best else best
+        out[idx] = best
+    return out
+
+
+def calculate_swap_makespans(processing_times: List[List[float]],
+                             sequence: List[int],
+                             completion_times: List[List[float]],
+                             positions: List[int]) -> np.ndarray:
+    """
+    Makespan after each adjacent swap in positions, evaluated in parallel.
+
+    For best-improvement scans. The head table is taken from the cached
+    completion matrix and the tail table is built once (O(n*m)); every
+    candidate swap then only recomputes the two swapped rows against them,
+    so the whole scan costs O(n*m) instead of O(n^2*m). No completion matrix
+    is materialized; the caller rebuilds the matrix of the swap it accepts.
+    Positions are not validated here.
+
+    Args:
+        processing_times: Matrix of processing times
+        sequence: Current job sequence
+        completion_times: Completion time matrix of sequence
+        positions: Swap positions (pos swaps with pos+1)
+
+    Returns:
+        Array whose entry i is the makespan after swapping positions[i]
+    """
+    P = _as_array(processing_times)
+    pos_arr = np.asarray(positions, dtype=np.int64)
+    out = np.zeros(pos_arr.shape[0])
+    if pos_arr.shape[0] == 0 or P.shape[1] == 0:
+        return out
+    seq = _as_index_array(sequence)
+    # Both tables live only for this call, so they come from this thread's
+    # scratch pool instead of two fresh (n+1, m) allocations per scan
+    heads, tails = _scratch_buffers((seq.shape[0] + 1, P.shape[1]), 2, pool='swap_tables')
+    heads[0] = 0.0
+    heads[1:] = completion_times
+    if NUMBA_AVAILABLE:
+        _tail_table_kernel(P, seq, tails)
+        return _swap_makespans_kernel(P, seq, heads, tails, pos_arr, out)
+
+    # Without Numba the kernel would run per cell on NumPy scalars: the same
+    # recurrence is vectorized across the candidates instead, one NumPy
+    # operation per machine for all swaps (as in calculate_makespan_many)
+    tails[:] = calculate_tail_table(P, seq)
+    first = P[seq[pos_arr + 1]]
+    second = P[seq[pos_arr]]
+    up = heads[pos_arr]
+    down = tails[pos_arr + 2]
+    f1 = np.zeros(pos_arr.shape[0])
+    f2 = np.zeros(pos_arr.shape[0])
+    for j in range(P.shape[1]):
+        f1 = np.maximum(up[:, j], f1) + first[:, j]
+        f2 = np.maximum(f1, f2) + second[:, j]
+        np.maximum(out, f2 + down[:, j], out=out)
+    return out
+
+
+def _fill_completion_rows(processing_times, jobs, completion_times: List[List[float]],
+                          start_row: int, num_machines: int) -> None:
+    """
+    Fill completion_times rows start_row, start_row + 1, ... in place.
+
+    jobs yields the job of each of those rows in order; the row before
+    start_row (if any) must already be correct. This is the one list-based
+    copy of the recurrence, shared by the full, incremental and swap updates.
+
+    Rows of an ndarray matrix are converted to Python numbers as they are
+    bound: indexing the array per cell would box a NumPy scalar each time
+    and do the arithmetic in the storage dtype.
+    """
+    from_array = isinstance(processing_times, np.ndarray)
+    prev = completion_times[start_row - 1] if start_row > 0 else None
+    for seq_pos, job_idx in enumerate(jobs, start_row):
+        # Bind the job's times and the two rows once per job; the max is a
+        # conditional expression, which skips the builtin call per cell
+        job_times = processing_times[job_idx]
+        if from_array:
+            job_times = job_times.tolist()
+        row = completion_times[seq_pos]
+        if prev is None:
+            # First position: a plain prefix sum over the machines
+            row[:] = accumulate(job_times[:num_machines])
+        else:
+            # The first machine only waits for the previous job; every later
+            # cell is the general case, so the loop carries no position tests
+            left = prev[0] + job_times[0]
+            row[0] = left
+            for machine in range(1, num_machines):
+                up = prev[machine]
+                left = (up if up > left else left) + job_times[machine]
+                row[machine] = left
+        prev = row
 
 
 def calculate_completion_times(processing_times: List[List[float]],
-                               sequence: List[int]) -> List[List[float]]:
+                               sequence: List[int],
+                               as_array: bool = False) -> Union[List[List[float]], np.ndarray]:
     """
     Compute and return the full completion time matrix for a given sequence.
     This mirrors the recurrence used in calculate_makespan.
+
+    With as_array=True the matrix is returned as one (len(sequence), m)
+    float64 ndarray instead of nested lists (8 bytes per cell rather than a
+    boxed float each); with Numba it is filled by the compiled head-table
+    kernel and never exists as Python objects.
     """
-    if not processing_times or not sequence:
+    if as_array:
+        num_machines = matrix_shape(processing_times)[1] if len(processing_times) else 0
+        if len(sequence) == 0 or num_machines == 0:
+            return np.zeros((len(sequence), num_machines))
+        if NUMBA_AVAILABLE:
+            # Rows 1.. of the head table, a contiguous view of one buffer
+            return calculate_head_table(processing_times, sequence)[1:]
+        return np.array(calculate_completion_times(processing_times, sequence), dtype=np.float64)
+
+    if len(processing_times) == 0 or len(sequence) == 0:
         return []
-    num_jobs = len(processing_times)
-    num_machines = len(processing_times[0]) if num_jobs > 0 else 0
+    num_machines = matrix_shape(processing_times)[1]
+    if isinstance(processing_times, np.ndarray):
+        # Large matrices: the compiled head table holds the same rows
+        if NUMBA_AVAILABLE and processing_times.size >= _JIT_MIN_CELLS:
+            return calculate_head_table(processing_times, sequence)[1:].tolist()
+    if isinstance(sequence, np.ndarray):
+        sequence = sequence.tolist()
+    # One machine or one job: the matrix is a single running sum
+    if isinstance(processing_times, np.ndarray) and (num_machines == 1 or len(sequence) == 1):
+        if num_machines == 1:
+            return np.cumsum(processing_times[sequence, 0], dtype=np.float64)[:, None].tolist()
+        return [np.cumsum(processing_times[sequence[0]], dtype=np.float64).tolist()]
+    if num_machines == 1:
+        return [[c] for c in accumulate(processing_times[job_idx][0] for job_idx in sequence)]
+    if len(sequence) == 1:
+        return [list(accumulate(processing_times[sequence[0]]))]
     completion_times = [[0.0 for _ in range(num_machines)] for _ in range(len(sequence))]
-    for seq_pos, job_idx in enumerate(sequence):
-        for machine in range(num_machines):
-            proc_time = processing_times[job_idx][machine]
-            if seq_pos == 0 and machine == 0:
-                completion_times[seq_pos][machine] = proc_time
-            elif seq_pos == 0:
-                completion_times[seq_pos][machine] = (
-                    completion_times[seq_pos][machine - 1] + proc_time
-                )
-            elif machine == 0:
-                completion_times[seq_pos][machine] = (
-                    completion_times[seq_pos - 1][machine] + proc_time
-                )
-            else:
-                completion_times[seq_pos][machine] = (
-                    max(completion_times[seq_pos - 1][machine],
-                        completion_times[seq_pos][machine - 1]) + proc_time
-                )
+    _fill_completion_rows(processing_times, sequence, completion_times, 0, num_machines)
     return completion_times
 
 
+def update_completion_times(processing_times: List[List[float]],
+                            sequence: List[int],
+                            completion_times: List[List[float]],
+                            start_row: int) -> float:
+    """
+    Recompute the completion time rows from start_row onward, in place.
+
+    Rows before start_row are taken as correct for the (changed) sequence,
+    which holds for any move that leaves the jobs before start_row untouched.
+
+    Args:
+        processing_times: Matrix of processing times
+        sequence: Job sequence the matrix should describe
+        completion_times: n x m completion matrix, updated in place
+        start_row: First sequence position whose row is recomputed
+
+    Returns:
+        The makespan of sequence
+    """
+    n = len(sequence)
+    if n == 0:
+        return 0.0
+    num_machines = matrix_shape(processing_times)[1]
+    if isinstance(sequence, np.ndarray):
+        sequence = sequence.tolist()
+    start_row = max(0, start_row)
+    _fill_completion_rows(processing_times, islice(sequence, start_row, None),
+                          completion_times, start_row, num_machines)
+    return completion_times[-1][-1]
+
+
 def calculate_makespan_delta(processing_times: List[List[float]],
                              sequence: List[int],
                              swap_pos: int,
-                             completion_times: List[List[float]]) -> Tuple[float, List[List[float]]]:
+                             completion_times: List[List[float]],
+                             out: Optional[List[List[float]]] = None) -> Tuple[float, List[List[float]]]:
     """
     Fast makespan recomputation for swapping adjacent jobs at swap_pos and swap_pos+1.
     Recomputes completion times from swap_pos onward using the standard recurrence.
 
+    If out is given, the updated matrix is written into it instead of a fresh
+    copy. out may be completion_times itself: rows before swap_pos are never
+    changed, so the update is then done in place without any allocation.
+
     Returns the new makespan and the updated completion time matrix.
     """
     n = len(sequence)
@@ -113,117 +606,559 @@ def calculate_makespan_delta(processing_times: List[List[float]],
     if swap_pos < 0 or swap_pos >= n - 1:
         raise ValueError("swap_pos out of range")
 
-    num_machines = len(processing_times[0]) if processing_times else 0
+    num_machines = matrix_shape(processing_times)[1]
+    if isinstance(sequence, np.ndarray):
+        sequence = sequence.tolist()
 
-    # Apply the swap to a copy of the sequence
-    new_seq = sequence.copy()
-    new_seq[swap_pos], new_seq[swap_pos + 1] = new_seq[swap_pos + 1], new_seq[swap_pos]
+    # The swap is applied virtually: the two swapped jobs are read in reverse
+    # order below, so the sequence itself is never copied
+    first_job, second_job = sequence[swap_pos + 1], sequence[swap_pos]
 
-    # Prepare a new completion matrix; copy rows before swap_pos as-is
-    new_ct = (
-        [row[:] for row in completion_times]
-        if completion_times
-        else [[0.0 for _ in range(num_machines)] for _ in range(n)]
-    )
+    # Prepare the target matrix; rows before swap_pos are taken over as-is
+    if out is not None:
+        new_ct = out
+        if out is not completion_times and completion_times:
+            for row in range(swap_pos):
+                new_ct[row][:] = completion_times[row]
+    else:
+        new_ct = (
+            [row[:] for row in completion_times]
+            if completion_times
+            else [[0.0 for _ in range(num_machines)] for _ in range(n)]
+        )
 
-    start_row = max(0, swap_pos)
-    for seq_pos in range(start_row, n):
-        job_idx = new_seq[seq_pos]
-        for machine in range(num_machines):
-            proc_time = processing_times[job_idx][machine]
-            if seq_pos == 0 and machine == 0:
-                new_ct[seq_pos][machine] = proc_time
-            elif seq_pos == 0:
-                new_ct[seq_pos][machine] = new_ct[seq_pos][machine - 1] + proc_time
-            elif machine == 0:
-                new_ct[seq_pos][machine] = new_ct[seq_pos - 1][machine] + proc_time
-            else:
-                new_ct[seq_pos][machine] = max(new_ct[seq_pos - 1][machine], new_ct[seq_pos][machine - 1]) + proc_time
+    jobs = chain((first_job, second_job), islice(sequence, swap_pos + 2, None))
+    _fill_completion_rows(processing_times, jobs, new_ct, swap_pos, num_machines)
 
     return (new_ct[-1][-1] if new_ct else 0.0), new_ct
 
 
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _first_improving_swap_kernel(P, sequence, ct, positions, threshold, out):
+    # Tries the adjacent swaps at positions in order. Rows before a swap are
+    # read straight from ct, the rest are recomputed into out; the first swap
+    # whose makespan beats threshold leaves its full matrix in out. out is
+    # the float64 recurrence itself, not a head/tail price, so the test
+    # against threshold needs no rounding margin.
+    n = sequence.shape[0]
+    m = P.shape[1]
+    for idx in range(positions.shape[0]):
+        pos = positions[idx]
+        for i in range(pos, n):
+            if i == pos:
+                row = P[sequence[pos + 1]]
+            elif i == pos + 1:
+                row = P[sequence[pos]]
+            else:
+                row = P[sequence[i]]
+            left = 0.0
+            for k in range(m):
+                if i == 0:
+                    up = 0.0
+                elif i == pos:
+                    up = ct[i - 1, k]
+                else:
+                    up = out[i - 1, k]
+                left = (up if up > left else left) + row[k]
+                out[i, k] = left
+        if out[n - 1, m - 1] < threshold:
+            out[:pos] = ct[:pos]
+            return idx
+    return -1
+
+
+def find_first_improving_swap(processing_times: List[List[float]],
+                              sequence: List[int],
+                              completion_times: List[List[float]],
+                              positions: List[int],
+                              current_makespan: float,
+                              executor: Optional[Executor] = None) -> Tuple[Optional[int], float, Optional[List[List[float]]]]:
+    """
+    Scan adjacent swaps in the given order and stop at the first improving one.
+
+    Equivalent to calling calculate_makespan_delta for each position in turn;
+    with Numba and an ndarray matrix the whole scan runs in one compiled call.
+    Given a thread pool, long scans are split into contiguous chunks that run
+    concurrently (the kernel releases the GIL); the earliest chunk with a hit
+    wins, so the result is the same as the serial scan.
+
+    Args:
+        processing_times: Matrix of processing times
+        sequence: Current job sequence
+        completion_times: Completion time matrix of sequence
+        positions: Swap positions (pos swaps with pos+1) in scan order
+        current_makespan: Makespan a swap has to beat
+        executor: Optional thread pool used to scan chunks in parallel
+
+    Returns:
+        (pos, new_makespan, new_completion_times) of the first improving swap,
+        or (None, current_makespan, None) if there is none
+    """
+    if NUMBA_AVAILABLE and isinstance(processing_times, np.ndarray) and len(positions) > 0:
+        P = _as_array(processing_times)
+        # Completion tables are float64 whatever the storage dtype of P: a
+        # float32 table would round every cell, and the scan compares the
+        # result against the float64 makespan of the recurrence
+        ct = np.asarray(completion_times, dtype=np.float64)
+        seq = _as_index_array(sequence)
+        pos_arr = np.asarray(positions, dtype=np.int64)
+        threshold = float(current_makespan)
+
+        if executor is not None and pos_arr.shape[0] * ct.size >= _PARALLEL_MIN_WORK:
+            chunks = [c for c in np.array_split(pos_arr, min(len(pos_arr), os.cpu_count() or 1)) if len(c)]
+            outs = _scratch_buffers(ct.shape, len(chunks))
+            futures = [executor.submit(_first_improving_swap_kernel, P, seq, ct, chunk, threshold, out)
+                       for chunk, out in zip(chunks, outs)]
+            for chunk, out, future in zip(chunks, outs, futures):
+                idx = future.result()
+                if idx >= 0:
+                    for later in futures:
+                        later.cancel()
+                    # Chunks already running still write into the shared
+                    # scratch buffers, so let them finish before reusing them
+                    wait(futures)
+                    return int(chunk[idx]), float(out[-1, -1]), out.tolist()
+            return None, current_makespan, None
+
+        out = _scratch_buffers(ct.shape, 1)[0]
+        idx = _first_improving_swap_kernel(P, seq, ct, pos_arr, threshold, out)
+        if idx < 0:
+            return None, current_makespan, None
+        return int(positions[idx]), float(out[-1, -1]), out.tolist()
+
+    if isinstance(sequence, np.ndarray):
+        sequence = sequence.tolist()
+    if isinstance(positions, np.ndarray):
+        positions = positions.tolist()
+    if len(positions) == 0:
+        return None, current_makespan, None
+    # Price every swap in O(m) from the head/tail tables, then rebuild the
+    # matrices of the candidates in order until one improves. Prices within
+    # price_tolerance() count as candidates and the delta recurrence decides,
+    # so rounding in the head/tail sums cannot change the result.
+    makespans = calculate_swap_makespans(processing_times, sequence, completion_times, positions)
+    limit = current_makespan + price_tolerance(current_makespan)
+    for idx in np.flatnonzero(makespans < limit).tolist():
+        pos = positions[idx]
+        new_makespan, new_ct = calculate_makespan_delta(processing_times, sequence, pos, completion_times)
+        if new_makespan < current_makespan:
+            return pos, new_makespan, new_ct
+    return None, current_makespan, None
+
+
+def find_best_improving_swap(processing_times: List[List[float]],
+                             sequence: List[int],
+                             completion_times: List[List[float]],
+                             positions: List[int],
+                             current_makespan: float) -> Tuple[Optional[int], float, Optional[List[List[float]]]]:
+    """
+    Find the adjacent swap with the lowest makespan, if it improves.
+
+    Every candidate is priced in O(m) by calculate_swap_makespans. The swaps
+    whose price is within rounding (price_tolerance) of the lowest price are
+    then recomputed with calculate_makespan_delta, and the best recurrence
+    makespan wins. The result is the same as recomputing every swap, and the
+    first position in the given order wins ties.
+
+    Args:
+        processing_times: Matrix of processing times
+        sequence: Current job sequence
+        completion_times: Completion time matrix of sequence
+        positions: Swap positions (pos swaps with pos+1) in scan order
+        current_makespan: Makespan a swap has to beat
+
+    Returns:
+        (pos, new_makespan, new_completion_times) of the best swap if its
+        makespan is below current_makespan, else (None, current_makespan, None)
+    """
+    if len(positions) == 0:
+        return None, current_makespan, None
+    if isinstance(positions, np.ndarray):
+        positions = positions.tolist()
+    makespans = calculate_swap_makespans(processing_times, sequence, completion_times, positions)
+    tol = price_tolerance(current_makespan)
+    # A swap can only tie the best recurrence makespan if its price is within
+    # twice the rounding margin of the lowest price
+    limit = min(float(makespans.min()) + 2 * tol, current_makespan + tol)
+    best_pos, best_makespan, best_ct = None, current_makespan, None
+    for idx in np.flatnonzero(makespans <= limit).tolist():
+        pos = positions[idx]
+        new_makespan, new_ct = calculate_makespan_delta(processing_times, sequence, pos, completion_times)
+        if new_makespan < best_makespan:
+            best_pos, best_makespan, best_ct = pos, new_makespan, new_ct
+    return best_pos, best_makespan, best_ct
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _head_table_kernel(P, sequence, e):
+    # e[i, j] is the completion time of the first i jobs on machine j (e[0] is zero)
+    m = P.shape[1]
+    e[0, :] = 0.0
+    for i in range(1, sequence.shape[0] + 1):
+        row = P[sequence[i - 1]]
+        left = 0.0
+        for j in range(m):
+            up = e[i - 1, j]
+            left = (up if up > left else left) + row[j]
+            e[i, j] = left
+    return e
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _insertion_makespans_kernel(P, sequence, skip, job, known_heads, out):
+    # The partial sequence is `sequence` with position `skip` left out
+    # (skip == len(sequence) keeps every job), so no list is materialized.
+    k = sequence.shape[0] - (1 if skip < sequence.shape[0] else 0)
+    m = P.shape[1]
+    # Heads: e[i, j] is the completion time of the first i jobs on machine j.
+    # Rows up to `skip` do not depend on the removed job, so the caller's
+    # head table of the full sequence is reused for them.
+    e = np.empty((k + 1, m))
+    start = known_heads.shape[0]
+    e[:start] = known_heads
+    for i in range(start, k + 1):
+        row = P[sequence[i - 1 if i - 1 < skip else i]]
+        left = 0.0
+        for j in range(m):
+            up = e[i - 1, j]
+            left = (up if up > left else left) + row[j]
+            e[i, j] = left
+    # Tails: q[i, j] is the time from the start of job i-1 on machine j to the end
+    q = np.zeros((k + 2, m))
+    for i in range(k, 0, -1):
+        row = P[sequence[i - 1 if i - 1 < skip else i]]
+        right = 0.0
+        for j in range(m - 1, -1, -1):
+            down = q[i + 1, j]
+            right = (down if down > right else right) + row[j]
+            q[i, j] = right
+    # Insertion: f is the completion time of the new job placed after i jobs
+    job_row = P[job]
+    for i in range(k + 1):
+        f = 0.0
+        best = 0.0
+        for j in range(m):
+            up = e[i, j]
+            f = (up if up > f else f) + job_row[j]
+            total = f + q[i + 1, j]
+            best = total if total > best else best
+        out[i] = best
+    return out
+
+
+def calculate_insertion_makespans(processing_times: List[List[float]],
+                                  partial_sequence: List[int],
+                                  job_idx: int) -> np.ndarray:
+    """
+    Makespan of inserting job_idx at every position of a partial sequence.
+
+    Uses Taillard's head/tail acceleration: one forward pass (heads), one
+    backward pass (tails) and one pass for the inserted job evaluate all
+    k+1 positions in O(k*m) instead of O(k^2*m) for k separate recomputations.
+
+    Args:
+        processing_times: Matrix of processing times
+        partial_sequence: Sequence of job indices not containing job_idx
+        job_idx: Index of the job to insert
+
+    Returns:
+        Array of length len(partial_sequence) + 1 where entry i is the makespan
+        with job_idx inserted before partial_sequence[i] (the last entry appends)
+    """
+    P = _as_array(processing_times)
+    partial = _as_index_array(partial_sequence)
+    out = np.empty(partial.shape[0] + 1)
+    known_heads = np.zeros((1, P.shape[1]))
+    return _insertion_makespans_kernel(P, partial, partial.shape[0], job_idx, known_heads, out)
+
+
+def calculate_head_table(processing_times: List[List[float]],
+                         sequence: List[int]) -> np.ndarray:
+    """
+    Head (Taillard e) table of a sequence as an (n+1, m) array.
+
+    Row i holds the completion times of the first i jobs on every machine;
+    row 0 is all zeros. Pass it to calculate_move_makespans to evaluate
+    several moves of the same sequence without rebuilding the shared prefix.
+    """
+    P = _as_array(processing_times)
+    seq = _as_index_array(sequence)
+    if NUMBA_AVAILABLE:
+        e = np.empty((seq.shape[0] + 1, P.shape[1]))
+        return _head_table_kernel(P, seq, e)
+    # Without Numba: the list recurrence, then one conversion
+    e = np.zeros((seq.shape[0] + 1, P.shape[1]))
+    if seq.shape[0] > 0 and P.shape[1] > 0:
+        e[1:] = calculate_completion_times(P, seq)
+    return e
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _tail_table_kernel(P, sequence, q):
+    # q[i, j] is the time from the start of the job at position i on machine j
+    # to the end of the schedule of positions i.. (q[n] is zero)
+    n = sequence.shape[0]
+    m = P.shape[1]
+    q[n, :] = 0.0
+    for i in range(n - 1, -1, -1):
+        row = P[sequence[i]]
+        right = 0.0
+        for j in range(m - 1, -1, -1):
+            down = q[i + 1, j]
+            right = (down if down > right else right) + row[j]
+            q[i, j] = right
+    return q
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _delta_insert_kernel(job_row, head_row, tail_row):
+    # f is the completion time of the inserted job; the makespan is the
+    # longest path through it, max_j (f_j + tail_j)
+    f = 0.0
+    best = 0.0
+    for j in range(job_row.shape[0]):
+        up = head_row[j]
+        f = (up if up > f else f) + job_row[j]
+        total = f + tail_row[j]
+        best = total if total > best else best
+    return best
+
+
+def calculate_tail_table(processing_times: List[List[float]],
+                         sequence: List[int]) -> np.ndarray:
+    """
+    Tail (Taillard q) table of a sequence as an (n+1, m) array.
+
+    Row i holds, for every machine, the time from the start of the job at
+    position i to the end of the schedule of positions i onward; row n is all
+    zeros. Together with calculate_head_table it lets delta_insert price the
+    insertion of a job at any position in O(m).
+    """
+    P = _as_array(processing_times)
+    seq = _as_index_array(sequence)
+    if NUMBA_AVAILABLE:
+        q = np.empty((seq.shape[0] + 1, P.shape[1]))
+        return _tail_table_kernel(P, seq, q)
+    # Without Numba: the tails are the completion times of the reversed
+    # sequence on the reversed machines, so the list recurrence gives them too
+    q = np.zeros((seq.shape[0] + 1, P.shape[1]))
+    if seq.shape[0] > 0 and P.shape[1] > 0:
+        q[:-1] = np.asarray(calculate_completion_times(P[:, ::-1], seq[::-1]))[::-1, ::-1]
+    return q
+
+
+def delta_insert(processing_times: List[List[float]],
+                 heads: np.ndarray,
+                 tails: np.ndarray,
+                 job_idx: int,
+                 pos: int) -> float:
+    """
+    Makespan of inserting job_idx before position pos of a sequence, in O(m).
+
+    Uses Taillard's acceleration: with the head and tail tables of the
+    sequence (see calculate_head_table and calculate_tail_table), the new makespan
+    is max_j (f[j] + q[pos, j]), where f is the completion time of the
+    inserted job started after the first pos jobs. The tables are not
+    changed, so any number of positions and jobs can be priced from them.
+
+    Args:
+        processing_times: Matrix of processing times
+        heads: Head table of the sequence, shape (n+1, m)
+        tails: Tail table of the sequence, shape (n+1, m)
+        job_idx: Job to insert (not part of the sequence)
+        pos: Insertion position, 0..n (n appends)
+
+    Returns:
+        Makespan of the sequence with job_idx inserted at pos
+    """
+    P = _as_array(processing_times)
+    return float(_delta_insert_kernel(P[job_idx], heads[pos], tails[pos]))
+
+
+def calculate_move_makespans(processing_times: List[List[float]],
+                             sequence: List[int],
+                             from_pos: int,
+                             heads: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Makespan of moving the job at from_pos to every position of the sequence.
+
+    Same Taillard evaluation as calculate_insertion_makespans, but the job is
+    removed virtually inside the kernel instead of slicing a partial sequence.
+    If the head table of the sequence is given (see calculate_head_table),
+    only the rows after from_pos are recomputed.
+
+    Returns:
+        Array of length len(sequence) where entry t is the makespan after
+        moving sequence[from_pos] so that it ends up at index t
+    """
+    P = _as_array(processing_times)
+    seq = _as_index_array(sequence)
+    out = np.empty(seq.shape[0])
+    if heads is None:
+        known_heads = np.zeros((1, P.shape[1]))
+    else:
+        known_heads = heads[:from_pos + 1]
+    return _insertion_makespans_kernel(P, seq, from_pos, seq[from_pos], known_heads, out)
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def _sequence_quality_kernel(P, sequence, idle, busy):
+    # One rolling-row pass: before the job at position i starts on machine k,
+    # the gap between C[i-1][k] (row[k]) and C[i][k-1] (left) is added to
+    # machine k's idle time and its processing time to the busy time, so no
+    # completion matrix is materialized. Returns the makespan.
+    # Unlike the other kernels this one keeps a branch: a branchless
+    # idle[k] += max(gap, 0) turns it into a read-modify-write on every cell,
+    # which measured 40-100% slower than the (well predicted) branch.
+    m = P.shape[1]
+    row = np.zeros(m)
+    for k in range(m):
+        idle[k] = 0.0
+        busy[k] = 0.0
+    for i in range(sequence.shape[0]):
+        job_row = P[sequence[i]]
+        left = 0.0
+        for k in range(m):
+            up = row[k]
+            if up > left:
+                if i > 0:
+                    idle[k] += up - left
+                left = up
+            left += job_row[k]
+            busy[k] += job_row[k]
+            row[k] = left
+    return row[m - 1] if m > 0 else 0.0
+
+
 def calculate_idle_times(processing_times: List[List[float]], 
-                        sequence: List[int]) -> Tuple[List[float], float]:
+                        sequence: List[int],
+                        completion_times: Optional[List[List[float]]] = None) -> Tuple[List[float], float]:
     """
     Calculate machine idle times for a given sequence.
+
+    The idle time of machine k before the job at position i is
+    max(0, C[i-1][k] - C[i][k-1]) (with C[i][-1] = 0); all cells are
+    evaluated in one vectorized pass over the completion matrix if the caller
+    has it (or, without Numba, over one built by the list recurrence),
+    otherwise accumulated during a single compiled rolling-row recurrence.
     
     Args:
         processing_times: Matrix of processing times
         sequence: Sequence of job indices
+        completion_times: Optional completion matrix of sequence, if the
+                          caller already has it (it is computed otherwise)
         
     Returns:
         Tuple of (idle_times_per_machine, total_idle_time)
     """
-    if not processing_times or not sequence:
+    if len(processing_times) == 0 or len(sequence) == 0:
         return [], 0.0
-        
-    num_jobs = len(processing_times)
-    num_machines = len(processing_times[0]) if num_jobs > 0 else 0
-    
-    # Initialize completion time matrix
-    completion_times = [[0.0 for _ in range(num_machines)] for _ in range(len(sequence))]
-    
-    # Calculate completion times
-    for seq_pos, job_idx in enumerate(sequence):
-        for machine in range(num_machines):
-            proc_time = processing_times[job_idx][machine]
-            
-            if seq_pos == 0 and machine == 0:
-                completion_times[seq_pos][machine] = proc_time
-            elif seq_pos == 0:
-                completion_times[seq_pos][machine] = (
-                    completion_times[seq_pos][machine - 1] + proc_time
-                )
-            elif machine == 0:
-                completion_times[seq_pos][machine] = (
-                    completion_times[seq_pos - 1][machine] + proc_time
-                )
-            else:
-                completion_times[seq_pos][machine] = (
-                    max(completion_times[seq_pos - 1][machine],
-                        completion_times[seq_pos][machine - 1]) + proc_time
-                )
-    
-    # Calculate idle times
-    idle_times = [0.0] * num_machines
-    total_idle = 0.0
-    
-    for machine in range(num_machines):
-        for job_pos in range(1, len(sequence)):
-            # Idle time is the time the machine waits for the previous job to complete
-            idle = max(0, completion_times[job_pos - 1][machine] - 
-                       (completion_times[job_pos][machine - 1] if machine > 0 else 0))
-            idle_times[machine] += idle
-            total_idle += idle
-    
-    return idle_times, total_idle
+
+    if completion_times is None:
+        if NUMBA_AVAILABLE:
+            P = _as_array(processing_times)
+            idle_times = np.empty(P.shape[1])
+            _sequence_quality_kernel(P, _as_index_array(sequence), idle_times, np.empty(P.shape[1]))
+            return idle_times.tolist(), float(idle_times.sum())
+        # Without Numba the kernel would run per cell on NumPy scalars: build
+        # the matrix with the list recurrence and take the vectorized pass
+        completion_times = calculate_completion_times(processing_times, sequence)
+
+    C = np.asarray(completion_times, dtype=np.float64)
+
+    # Completion of the previous job on each machine vs. completion of the
+    # current job on the previous machine (zero for the first machine)
+    prev_job = C[:-1]
+    prev_machine = np.zeros_like(prev_job)
+    prev_machine[:, 1:] = C[1:, :-1]
+    idle_times = np.maximum(0.0, prev_job - prev_machine).sum(axis=0)
+
+    return idle_times.tolist(), float(idle_times.sum())
+
+
+def evaluate_sequence_quality(processing_times: List[List[float]],
+                              sequence: List[int]) -> Dict[str, Any]:
+    """
+    Makespan, idle times and machine utilization of a sequence in one pass.
+
+    Fuses what calculate_makespan and calculate_idle_times would compute
+    separately into a single rolling-row recurrence, so the matrix is read
+    once and no completion matrix is built. Without Numba the list
+    recurrence builds the completion matrix and the sums are vectorized.
+
+    Args:
+        processing_times: Matrix of processing times
+        sequence: Sequence of job indices
+
+    Returns:
+        Dictionary with 'makespan', 'idle_times' (per machine, as in
+        calculate_idle_times), 'total_idle', and 'utilization' (busy time of
+        each machine divided by the makespan)
+    """
+    if len(processing_times) == 0 or len(sequence) == 0:
+        return {'makespan': 0.0, 'idle_times': [], 'total_idle': 0.0, 'utilization': []}
+
+    P = _as_array(processing_times)
+    num_machines = P.shape[1]
+    seq = _as_index_array(sequence)
+    if NUMBA_AVAILABLE:
+        idle_times = np.empty(num_machines)
+        busy = np.empty(num_machines)
+        makespan = float(_sequence_quality_kernel(P, seq, idle_times, busy))
+    else:
+        # Without Numba the fused kernel would run per cell on NumPy scalars:
+        # one list recurrence, then vectorized idle and busy sums
+        completion_times = calculate_completion_times(P, seq)
+        idle_times = np.array(calculate_idle_times(P, seq, completion_times)[0])
+        busy = P[seq].sum(axis=0, dtype=np.float64)
+        makespan = float(completion_times[-1][-1]) if num_machines > 0 else 0.0
+    utilization = busy / makespan if makespan > 0 else np.zeros(num_machines)
+    return {
+        'makespan': makespan,
+        'idle_times': idle_times.tolist(),
+        'total_idle': float(idle_times.sum()),
+        'utilization': utilization.tolist(),
+    }
 
 
 def print_sequence_analysis(processing_times: List[List[float]], 
                           sequence: List[int], 
-                          job_names: List[str] = None) -> None:
+                          job_names: List[str] = None,
+                          metrics: Optional[Dict[str, Any]] = None) -> None:
     """
     Print analysis of a job sequence.
     
+    Nothing is computed or printed while LOG_LEVEL is 0, so the call can stay
+    in search loops and be silenced from one place.
+
     Args:
         processing_times: Matrix of processing times
         sequence: Sequence of job indices
         job_names: Optional list of job names for display
+        metrics: Optional metrics the caller already has for sequence (as
+                 returned by evaluate_sequence_quality; only 'makespan' is
+                 read), which skips recomputing them
     """
-    if not processing_times or not sequence:
+    if LOG_LEVEL <= 0:
+        return
+    if len(processing_times) == 0 or len(sequence) == 0:
         print("No sequence to analyze")
         return
         
-    num_jobs = len(processing_times)
-    num_machines = len(processing_times[0]) if num_jobs > 0 else 0
-    
+    # Calculate metrics unless the caller passed them in
+    if metrics is None:
+        makespan = calculate_makespan(processing_times, sequence)
+    else:
+        makespan = metrics['makespan']
+
+    # Bind the sequence string once; default names are only generated for
+    # the jobs actually shown, not for the whole instance
+    if isinstance(sequence, np.ndarray):
+        sequence = sequence.tolist()
     if job_names is None:
-        job_names = [f"Job_{i+1}" for i in range(num_jobs)]
-    
-    # Calculate metrics
-    makespan = calculate_makespan(processing_times, sequence)
-    
-    # Print analysis
-    print(f"\nSequence: {' -> '.join([job_names[i] for i in sequence])}")
-    print(f"Makespan: {makespan:.2f}")
+        sequence_str = ' -> '.join(f"Job_{i+1}" for i in sequence)
+    else:
+        sequence_str = ' -> '.join(job_names[i] for i in sequence)
+
+    # Build the report once and emit it with a single write
+    sys.stdout.write(f"\nSequence: {sequence_str}\nMakespan: {makespan:.2f}\n")
@@ -0,0 +1,35 @@
+"""
+Tests for compare_sequences, which ranks candidate sequences by makespan.
+
+Run with: python -m pytest -q
+"""
+
+import numpy as np
+import pytest
+
+from conftest import make_instance, reference_completion_times
+from makespan import compare_sequences
+
+
+def test_compare_sequences(instance):
+    P, sequence = instance
+    n = P.shape[0]
+    sequences = [np.random.default_rng(s).permutation(n).tolist() for s in range(5)]
+    sequences.append(list(sequences[0]))   # a tie with the first candidate
+    sequences.append(sequences[1][:max(1, n - 1)])   # a different length
+    ranking = compare_sequences(P, sequences)
+
+    assert sorted(i for i, _ in ranking) == list(range(len(sequences)))
+    for i, value in ranking:
+        assert value == reference_completion_times(P, sequences[i])[-1, -1]
+    values = [value for _, value in ranking]
+    assert values == sorted(values)
+    # Ties keep the input order
+    assert [i for i, _ in ranking].index(0) < [i for i, _ in ranking].index(5)
+
+
+def test_compare_sequences_rejects_bad_index():
+    P = make_instance(4, 3, False)
+    with pytest.raises(ValueError):
+        compare_sequences(P, [[0, 1, 2, 3], [0, 1, 2, 4]])
+    assert compare_sequences(P, []) == []
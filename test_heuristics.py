@@ -0,0 +1,103 @@
+"""
+Tests for the constructive heuristics and their per-instance data.
+
+Run with: python -m pytest -q
+"""
+
+import numpy as np
+import pytest
+
+import heuristics
+from conftest import make_instance
+from heuristics import (multi_start_construction, pendulum_heuristic, prepare_instance,
+                        randomized_constructive_heuristic)
+from main import _randomized_start
+from makespan import calculate_makespan
+
+
+def test_prepare_instance_matches_matrix():
+    P = np.arange(12, dtype=np.float64).reshape(4, 3)
+    instance = prepare_instance(P)
+    assert np.array_equal(instance.totals, P.sum(axis=1))
+    assert np.array_equal(instance.m1, P[:, 0])
+    assert instance.total_processing == P.sum()
+    assert pendulum_heuristic(instance).tolist() == pendulum_heuristic(P).tolist()
+
+
+@pytest.mark.parametrize('empty', [[], np.empty(0), np.empty((0, 3))])
+def test_prepare_instance_empty(empty):
+    instance = prepare_instance(empty)
+    assert instance.P.ndim == 2
+    assert instance.totals.size == 0 and instance.m1.size == 0
+    assert instance.total_processing == 0.0
+
+
+@pytest.mark.parametrize('bad', [np.arange(4.0), np.ones((2, 3, 4))])
+def test_prepare_instance_rejects_non_matrix(bad):
+    with pytest.raises(ValueError, match="2-D jobs x machines"):
+        prepare_instance(bad)
+
+
+@pytest.mark.parametrize('method, param', [('alpha', 0.6), ('kbest', 3)])
+def test_multi_start_construction_is_deterministic(method, param):
+    P = np.random.default_rng(4).integers(1, 100, (12, 4)).astype(np.float64)
+    runs = multi_start_construction(P, 4, method, param, first_seed=7, max_workers=2)
+    again = multi_start_construction(prepare_instance(P), 4, method, param, first_seed=7,
+                                     max_workers=2)
+    assert [r.tolist() for r in runs] == [r.tolist() for r in again]
+    # Same sequences, in seed order, as sequential calls
+    for seed, run in enumerate(runs, 7):
+        expected = randomized_constructive_heuristic(P, method=method, param=param, seed=seed)
+        assert run.tolist() == expected.tolist()
+    assert multi_start_construction(P, 0, method, param) == []
+
+
+def test_randomized_start_keeps_the_best_construction():
+    instance = prepare_instance(np.random.default_rng(5).integers(1, 100, (12, 4)).astype(np.float64))
+    single = _randomized_start(instance, 'alpha', 0.6, 1)
+    assert single.tolist() == randomized_constructive_heuristic(
+        instance, method='alpha', param=0.6, seed=42).tolist()
+
+    best = _randomized_start(instance, 'alpha', 0.6, 4)
+    makespans = [calculate_makespan(instance.P, randomized_constructive_heuristic(
+        instance, method='alpha', param=0.6, seed=seed)) for seed in range(42, 46)]
+    assert calculate_makespan(instance.P, best) == min(makespans)
+    assert _randomized_start(instance, 'alpha', 0.6, 4).tolist() == best.tolist()
+
+
+@pytest.mark.parametrize('num_jobs', [1, 2, 9, 30])
+def test_alpha_construction_backends_agree(num_jobs, fractional, monkeypatch):
+    P = make_instance(num_jobs, 4, fractional, seed=num_jobs)
+    runs = {}
+    for seed in range(5):
+        runs[seed] = randomized_constructive_heuristic(P, method='alpha', param=0.6, seed=seed)
+        assert sorted(runs[seed].tolist()) == list(range(num_jobs))
+
+    # The NumPy branch draws the same jobs from the same seed
+    monkeypatch.setattr(heuristics, 'NUMBA_AVAILABLE', False)
+    monkeypatch.setattr(heuristics, '_compute_probs_c', None)
+    for seed, expected in runs.items():
+        result = randomized_constructive_heuristic(P, method='alpha', param=0.6, seed=seed)
+        assert result.tolist() == expected.tolist()
+
+
+def test_cython_alpha_probabilities(fractional, monkeypatch):
+    construct = pytest.importorskip('_construct')
+    totals = make_instance(12, 4, fractional, seed=2).sum(axis=1)
+    mask = np.ones(12, dtype=bool)
+    mask[[0, 5, 6]] = False
+    scores = totals[mask]
+    normalized = (scores - scores.min()) / np.ptp(scores)
+    expected = np.exp(-0.6 * normalized)
+    expected /= expected.sum()
+    assert np.allclose(construct.compute_probs(totals, mask.view(np.uint8), 0.6), expected)
+    # Equal totals give uniform odds
+    assert np.allclose(construct.compute_probs(np.full(4, 3.0), np.ones(4, dtype=np.uint8), 0.6), 0.25)
+
+    # The construction draws the same jobs as with the NumPy branch
+    P = make_instance(20, 4, fractional, seed=3)
+    monkeypatch.setattr(heuristics, 'NUMBA_AVAILABLE', False)
+    with_c = randomized_constructive_heuristic(P, method='alpha', param=0.6, seed=1)
+    monkeypatch.setattr(heuristics, '_compute_probs_c', None)
+    assert randomized_constructive_heuristic(P, method='alpha', param=0.6, seed=1).tolist() == \
+        with_c.tolist()
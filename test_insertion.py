@@ -0,0 +1,61 @@
+"""
+Tests for the Taillard head/tail insertion pricing.
+
+The prices add the same processing times as the recurrence in another order,
+so on fractional instances they are compared within price_tolerance.
+
+Run with: python -m pytest -q
+"""
+
+import numpy as np
+
+from conftest import moved, reference_completion_times
+from makespan import (
+    calculate_head_table,
+    calculate_insertion_makespans,
+    calculate_move_makespans,
+    calculate_tail_table,
+    delta_insert,
+    price_tolerance,
+)
+
+
+def test_insertion_makespans_match_reference(instance):
+    P, sequence = instance
+    job, partial = sequence[0], sequence[1:]
+    expected = [reference_completion_times(P, partial[:i] + [job] + partial[i:])[-1, -1]
+                for i in range(len(partial) + 1)]
+    tol = price_tolerance(max(expected))
+    assert np.allclose(calculate_insertion_makespans(P, partial, job), expected, rtol=0, atol=tol)
+
+
+def test_move_makespans_match_reference(instance):
+    P, sequence = instance
+    n = len(sequence)
+    for from_pos in range(n):
+        expected = [reference_completion_times(P, moved(sequence, from_pos, t))[-1, -1] for t in range(n)]
+        tol = price_tolerance(max(expected))
+        assert np.allclose(calculate_move_makespans(P, sequence, from_pos), expected, rtol=0, atol=tol)
+
+
+def test_move_makespans_reuse_head_table(instance):
+    P, sequence = instance
+    n = len(sequence)
+    heads = calculate_head_table(P, sequence)
+    for from_pos in range(n):
+        expected = [reference_completion_times(P, moved(sequence, from_pos, t))[-1, -1] for t in range(n)]
+        tol = price_tolerance(max(expected))
+        assert np.allclose(calculate_move_makespans(P, sequence, from_pos, heads), expected,
+                           rtol=0, atol=tol)
+
+
+def test_delta_insert_matches_reference(instance):
+    P, sequence = instance
+    job, partial = sequence[0], sequence[1:]
+    expected = [reference_completion_times(P, partial[:i] + [job] + partial[i:])[-1, -1]
+                for i in range(len(partial) + 1)]
+    tol = price_tolerance(max(expected))
+    heads = calculate_head_table(P, partial)
+    tails = calculate_tail_table(P, partial)
+    priced = [delta_insert(P, heads, tails, job, i) for i in range(len(partial) + 1)]
+    assert np.allclose(priced, expected, rtol=0, atol=tol)
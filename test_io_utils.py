@@ -0,0 +1,111 @@
+"""
+Tests for the instance readers.
+
+Run with: python -m pytest -q
+"""
+
+import os
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+import io_utils
+from io_utils import read_instance, read_taillard_txt
+
+
+def write_taillard(path, rows, separator=' '):
+    """Write a Taillard-style file with one row of job times per machine."""
+    lines = [
+        "number of jobs, number of machines, initial seed, upper bound and lower bound :",
+        f"          {len(rows[0])}           {len(rows)}   873654221        1278        1232",
+        "processing times :",
+    ]
+    lines += [separator.join(str(v) for v in row) for row in rows]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+# Machines as rows, as in the file
+ROWS = [[54, 83, 15], [79, 3, 11]]
+
+
+def test_taillard_integer_times_use_float32(tmp_path):
+    P, names = read_taillard_txt(write_taillard(tmp_path / 'ta.txt', ROWS))
+    assert P.dtype == np.float32 and P.flags.c_contiguous
+    assert P.tolist() == np.array(ROWS, dtype=np.float64).T.tolist()
+    assert names == ['Job_1', 'Job_2', 'Job_3']
+
+
+@pytest.mark.parametrize('rows', [
+    [[54, 83.5, 15], [79, 3, 11]],      # fractional
+    [[54, 2**24 + 1, 15], [79, 3, 11]],  # integer, but not exact in float32
+], ids=['fractional', 'beyond-2**24'])
+def test_taillard_inexact_times_stay_float64(tmp_path, rows):
+    P, _ = read_taillard_txt(write_taillard(tmp_path / 'ta.txt', rows))
+    assert P.dtype == np.float64
+    assert P.tolist() == np.array(rows, dtype=np.float64).T.tolist()
+
+
+def test_taillard_largest_exact_integer_stays_float32(tmp_path):
+    rows = [[54, 2**24, 15], [79, 3, 11]]
+    P, _ = read_taillard_txt(write_taillard(tmp_path / 'ta.txt', rows))
+    assert P.dtype == np.float32
+    assert P[1, 0] == 2**24
+
+
+def test_taillard_token_fallback_parses_decimals(tmp_path):
+    rows = [[54, 1.5, 15], [79, 3, 11]]
+    spaced, _ = read_taillard_txt(write_taillard(tmp_path / 'spaced.txt', rows))
+    commas, _ = read_taillard_txt(write_taillard(tmp_path / 'commas.txt', rows, separator=', '))
+    assert commas.dtype == spaced.dtype == np.float64
+    assert commas.tolist() == spaced.tolist() == np.array(rows, dtype=np.float64).T.tolist()
+
+
+def test_taillard_explicit_dtype(tmp_path):
+    P, _ = read_taillard_txt(write_taillard(tmp_path / 'ta.txt', ROWS), dtype=np.float64)
+    assert P.dtype == np.float64
+
+
+@pytest.fixture
+def counted_reads(monkeypatch):
+    """Start from an empty instance cache and count the real parses."""
+    monkeypatch.setattr(io_utils, '_instance_cache', OrderedDict())
+    calls = []
+    uncached = io_utils._read_instance_uncached
+
+    def counting(*args):
+        calls.append(args)
+        return uncached(*args)
+
+    monkeypatch.setattr(io_utils, '_read_instance_uncached', counting)
+    return calls
+
+
+def test_read_instance_memoizes_unchanged_files(tmp_path, counted_reads):
+    path = write_taillard(tmp_path / 'ta.txt', ROWS)
+    first, names = read_instance(path)
+    second, _ = read_instance(path)
+    assert len(counted_reads) == 1
+    assert np.array_equal(first, second) and first.dtype == second.dtype
+    # Every call gets its own copy
+    first[0, 0] = -1.0
+    names.append('extra')
+    third, third_names = read_instance(path)
+    assert third[0, 0] == ROWS[0][0] and len(third_names) == 3
+    assert len(counted_reads) == 1
+
+    # Another storage type is a separate entry
+    assert read_instance(path, dtype=np.float64)[0].dtype == np.float64
+    assert len(counted_reads) == 2
+
+
+def test_read_instance_rereads_changed_files(tmp_path, counted_reads):
+    path = write_taillard(tmp_path / 'ta.txt', ROWS)
+    read_instance(path)
+    write_taillard(tmp_path / 'ta.txt', [[1, 2, 3], [4, 5, 6]])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    P, _ = read_instance(path)
+    assert len(counted_reads) == 2
+    assert P.tolist() == [[1, 4], [2, 5], [3, 6]]
@@ -0,0 +1,41 @@
+"""
+Tests for the swap/insertion local search and its multi-walk driver.
+
+Run with: python -m pytest -q
+"""
+
+import pytest
+
+import makespan
+from conftest import make_instance, reference_completion_times
+from local_search import local_search_main, multi_walk_local_search
+
+
+@pytest.mark.parametrize('mode', ['best', 'first'])
+def test_local_search_backends_agree(fractional, mode, monkeypatch):
+    P = make_instance(25, 6, fractional, seed=5)
+    start = list(range(25))
+    kwargs = dict(max_iterations=30, search_mode=mode, time_budget_seconds=None)
+    compiled = local_search_main(start, P, **kwargs)
+    as_lists = local_search_main(start, P.tolist(), **kwargs)
+    monkeypatch.setattr(makespan, 'NUMBA_AVAILABLE', False)
+    fallback = local_search_main(start, P, **kwargs)
+
+    assert compiled[:2] == as_lists[:2] == fallback[:2]
+    assert compiled[1] == reference_completion_times(P, compiled[0])[-1, -1]
+    assert compiled[1] <= reference_completion_times(P, start)[-1, -1]
+
+
+def test_multi_walk_local_search(fractional):
+    P = make_instance(15, 5, fractional, seed=7)
+    start = list(range(15))
+    kwargs = dict(max_iterations=20, time_budget_seconds=None)
+    best_seq, best_mk, _, _ = multi_walk_local_search(start, P, num_walks=3, seed=11,
+                                                      max_workers=2, **kwargs)
+    assert sorted(best_seq) == start
+    assert best_mk == reference_completion_times(P, best_seq)[-1, -1]
+
+    # The result is the best of the walks, and walk 0 starts from start itself
+    assert best_mk <= local_search_main(start, P, **kwargs)[1]
+    again = multi_walk_local_search(start, P, num_walks=3, seed=11, max_workers=2, **kwargs)
+    assert again[:2] == (best_seq, best_mk)
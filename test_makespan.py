@@ -0,0 +1,115 @@
+"""
+Tests for the makespan and completion-time recurrences and their backends.
+
+The same recurrence exists as a list loop, Numba kernels (including the
+machine-tiled one above 32 machines), an optional Cython kernel and
+vectorized NumPy fallbacks. Every variant is checked against the reference
+recurrence in conftest.py.
+
+Run with: python -m pytest -q
+"""
+
+import numpy as np
+import pytest
+
+import makespan
+from conftest import make_instance, reference_completion_times
+from makespan import (
+    cached_makespan_evaluator,
+    calculate_completion_times,
+    calculate_head_table,
+    calculate_makespan,
+    calculate_makespan_many,
+)
+
+
+def test_makespan_matches_reference(instance):
+    P, sequence = instance
+    expected = reference_completion_times(P, sequence)[-1, -1]
+    assert calculate_makespan(P.tolist(), sequence) == expected
+    assert calculate_makespan(P, sequence) == expected
+    assert calculate_makespan(P, np.array(sequence, dtype=np.int32)) == expected
+    assert makespan._makespan_kernel(P, np.array(sequence, dtype=np.int64)) == expected
+
+
+def test_makespan_float32_storage(instance, fractional):
+    P, sequence = instance
+    if fractional:
+        pytest.skip("float32 storage is only used for integer-valued instances")
+    expected = reference_completion_times(P, sequence)[-1, -1]
+    assert calculate_makespan(P.astype(np.float32), np.array(sequence, dtype=np.int32)) == expected
+
+
+@pytest.mark.parametrize('num_machines', [32, 33, 48, 49, 70])
+@pytest.mark.parametrize('num_jobs', [0, 1, 7])
+def test_tiled_makespan_kernel(num_jobs, num_machines, fractional):
+    # Above 2 * _MACHINE_TILE machines the kernel sweeps one tile at a time;
+    # the widths straddle that switch and leave partial last tiles
+    P = make_instance(max(num_jobs, 1), num_machines, fractional, seed=num_machines)
+    sequence = np.random.default_rng(num_jobs).permutation(num_jobs).astype(np.int64)
+    expected = reference_completion_times(P, sequence)[-1, -1] if num_jobs else 0.0
+    assert makespan._makespan_kernel(P, sequence) == expected
+    if not fractional:
+        assert makespan._makespan_kernel(P.astype(np.float32), sequence.astype(np.int32)) == expected
+
+
+def test_makespan_fallbacks(instance, no_numba):
+    P, sequence = instance
+    expected = reference_completion_times(P, sequence)[-1, -1]
+    assert calculate_makespan(P, sequence) == expected
+    assert calculate_makespan(P.tolist(), sequence) == expected
+
+
+def test_cython_makespan(instance, monkeypatch):
+    construct = pytest.importorskip('_construct')
+    P, sequence = instance
+    expected = reference_completion_times(P, sequence)[-1, -1]
+    assert construct.makespan(P, np.array(sequence, dtype=np.int64)) == expected
+    assert construct.makespan(P.astype(np.float32), np.array(sequence, dtype=np.int32)) == \
+        reference_completion_times(P.astype(np.float32).astype(np.float64), sequence)[-1, -1]
+    # calculate_makespan routes to the extension when Numba is missing
+    monkeypatch.setattr(makespan, 'NUMBA_AVAILABLE', False)
+    assert calculate_makespan(P, sequence) == expected
+
+
+def test_completion_times_match_reference(instance):
+    P, sequence = instance
+    expected = reference_completion_times(P, sequence)
+    assert np.array_equal(calculate_completion_times(P.tolist(), sequence), expected)
+    assert np.array_equal(calculate_completion_times(P, sequence), expected)
+    assert np.array_equal(calculate_completion_times(P, sequence, as_array=True), expected)
+    assert np.array_equal(calculate_head_table(P, sequence)[1:], expected)
+
+
+def test_completion_times_fallback(instance, no_numba):
+    P, sequence = instance
+    expected = reference_completion_times(P, sequence)
+    assert np.array_equal(calculate_completion_times(P, sequence, as_array=True), expected)
+
+
+def test_makespan_many(instance):
+    P, sequence = instance
+    sequences = np.array([np.random.default_rng(s).permutation(P.shape[0]) for s in range(6)])
+    expected = [reference_completion_times(P, seq)[-1, -1] for seq in sequences]
+    assert calculate_makespan_many(P, sequences).tolist() == expected
+
+
+def test_makespan_many_fallback(instance, no_numba):
+    P, sequence = instance
+    sequences = np.array([np.random.default_rng(s).permutation(P.shape[0]) for s in range(6)])
+    expected = [reference_completion_times(P, seq)[-1, -1] for seq in sequences]
+    assert calculate_makespan_many(P, sequences).tolist() == expected
+
+
+def test_cached_makespan_evaluator(instance):
+    P, sequence = instance
+    evaluate = cached_makespan_evaluator(P)
+    expected = reference_completion_times(P, sequence)[-1, -1]
+    assert evaluate(sequence) == expected
+    assert evaluate(np.array(sequence, dtype=np.int64)) == expected
+    assert evaluate.cache_info().hits == 1
+    # The evaluator keeps its own snapshot of the matrix
+    P[sequence[0], 0] += 1000.0
+    assert evaluate(sequence) == expected
+    evaluate.cache_clear()
+    assert evaluate.cache_info().currsize == 0
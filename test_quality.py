@@ -0,0 +1,36 @@
+"""
+Tests for the idle-time and sequence-quality reports.
+
+Run with: python -m pytest -q
+"""
+
+import numpy as np
+import pytest
+
+import makespan
+from conftest import reference_completion_times
+from makespan import calculate_idle_times, evaluate_sequence_quality
+
+
+@pytest.mark.parametrize('backend', ['numba', 'fallback'])
+def test_idle_times_and_quality(instance, backend, monkeypatch):
+    P, sequence = instance
+    if backend == 'fallback':
+        monkeypatch.setattr(makespan, 'NUMBA_AVAILABLE', False)
+    C = reference_completion_times(P, sequence)
+    expected_idle = np.zeros(P.shape[1])
+    for i in range(1, len(sequence)):
+        for k in range(P.shape[1]):
+            left = C[i, k - 1] if k > 0 else 0.0
+            expected_idle[k] += max(0.0, C[i - 1, k] - left)
+
+    idle, total = calculate_idle_times(P, sequence)
+    assert np.allclose(idle, expected_idle)
+    assert np.isclose(total, expected_idle.sum())
+    idle, total = calculate_idle_times(P, sequence, C.tolist())
+    assert np.allclose(idle, expected_idle)
+
+    quality = evaluate_sequence_quality(P, sequence)
+    assert quality['makespan'] == C[-1, -1]
+    assert np.allclose(quality['idle_times'], expected_idle)
+    assert np.allclose(quality['utilization'], P.sum(axis=0) / C[-1, -1])
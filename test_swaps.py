@@ -0,0 +1,133 @@
+"""
+Tests for the adjacent-swap neighbourhood: incremental evaluation, the
+Taillard swap prices and the first- and best-improvement scans.
+
+Run with: python -m pytest -q
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import makespan
+from conftest import make_instance, reference_completion_times, swapped
+from makespan import (
+    calculate_completion_times,
+    calculate_head_table,
+    calculate_makespan_delta,
+    calculate_swap_makespans,
+    calculate_tail_table,
+    find_best_improving_swap,
+    find_first_improving_swap,
+    price_tolerance,
+)
+
+
+def test_makespan_delta_matches_reference(instance):
+    P, sequence = instance
+    if len(sequence) < 2:
+        pytest.skip("no adjacent swap")
+    ct = calculate_completion_times(P.tolist(), sequence)
+    for pos in range(len(sequence) - 1):
+        expected = reference_completion_times(P, swapped(sequence, pos))
+        value, new_ct = calculate_makespan_delta(P, sequence, pos, ct)
+        assert value == expected[-1, -1]
+        assert np.array_equal(new_ct, expected)
+
+
+def _brute_force_swaps(P, sequence, positions):
+    return [reference_completion_times(P, swapped(sequence, pos))[-1, -1] for pos in positions]
+
+
+@pytest.mark.parametrize('backend', ['numba', 'fallback'])
+def test_first_improving_swap_matches_brute_force(instance, backend, monkeypatch):
+    P, sequence = instance
+    if len(sequence) < 2:
+        pytest.skip("no adjacent swap")
+    if backend == 'fallback':
+        monkeypatch.setattr(makespan, 'NUMBA_AVAILABLE', False)
+    ct = calculate_completion_times(P.tolist(), sequence)
+    current = reference_completion_times(P, sequence)[-1, -1]
+    positions = list(range(len(sequence) - 1))
+    exact = _brute_force_swaps(P, sequence, positions)
+
+    pos, value, new_ct = find_first_improving_swap(P, sequence, ct, positions, current)
+    improving = [p for p, v in zip(positions, exact) if v < current]
+    if improving:
+        assert pos == improving[0]
+        assert value == exact[pos]
+        assert np.array_equal(new_ct, reference_completion_times(P, swapped(sequence, pos)))
+    else:
+        assert pos is None and value == current
+
+
+def test_first_improving_swap_thread_pool_matches_serial(monkeypatch):
+    # Force the chunked scan even on a small instance
+    monkeypatch.setattr(makespan, '_PARALLEL_MIN_WORK', 0)
+    P = make_instance(40, 6, True, seed=9)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for seed in range(5):
+            sequence = np.random.default_rng(seed).permutation(40).tolist()
+            ct = calculate_completion_times(P, sequence)
+            current = reference_completion_times(P, sequence)[-1, -1]
+            positions = np.random.default_rng(seed).permutation(39).tolist()
+            serial = find_first_improving_swap(P, sequence, ct, positions, current)
+            pooled = find_first_improving_swap(P, sequence, ct, positions, current, executor)
+            assert pooled[:2] == serial[:2]
+            assert (pooled[2] is None) == (serial[2] is None)
+            if serial[2] is not None:
+                assert np.array_equal(pooled[2], serial[2])
+
+
+@pytest.mark.parametrize('backend', ['numba', 'fallback'])
+def test_swap_makespans_price_every_swap(instance, backend, monkeypatch):
+    P, sequence = instance
+    if len(sequence) < 2:
+        pytest.skip("no adjacent swap")
+    if backend == 'fallback':
+        monkeypatch.setattr(makespan, 'NUMBA_AVAILABLE', False)
+    ct = calculate_completion_times(P, sequence)
+    positions = list(range(len(sequence) - 1))
+    expected = _brute_force_swaps(P, sequence, positions)
+    prices = calculate_swap_makespans(P, sequence, ct, positions)
+    assert np.allclose(prices, expected, rtol=0, atol=price_tolerance(max(expected)))
+
+    # The head and tail tables the prices are built from
+    assert np.array_equal(calculate_head_table(P, sequence)[1:], reference_completion_times(P, sequence))
+    tails = calculate_tail_table(P, sequence)
+    assert not tails[-1].any()
+    assert np.array_equal(tails[:-1], reference_completion_times(P[:, ::-1], sequence[::-1])[::-1, ::-1])
+
+
+@pytest.mark.parametrize('backend', ['numba', 'fallback'])
+def test_best_improving_swap_matches_brute_force(instance, backend, monkeypatch):
+    P, sequence = instance
+    if len(sequence) < 2:
+        pytest.skip("no adjacent swap")
+    if backend == 'fallback':
+        monkeypatch.setattr(makespan, 'NUMBA_AVAILABLE', False)
+    ct = calculate_completion_times(P.tolist(), sequence)
+    current = reference_completion_times(P, sequence)[-1, -1]
+    positions = list(range(len(sequence) - 1))
+    exact = _brute_force_swaps(P, sequence, positions)
+
+    pos, value, new_ct = find_best_improving_swap(P, sequence, ct, positions, current)
+    if min(exact) < current:
+        assert pos == positions[int(np.argmin(exact))]
+        assert value == min(exact)
+        assert np.array_equal(new_ct, reference_completion_times(P, swapped(sequence, pos)))
+    else:
+        assert pos is None and value == current
+
+
+def test_best_swap_ignores_rounded_ties():
+    # Two jobs with identical rows: swapping them never changes the makespan,
+    # whatever order the head/tail prices add the fractional times in
+    P = make_instance(8, 5, True, seed=3)
+    P[4] = P[3]
+    sequence = list(range(8))
+    ct = calculate_completion_times(P, sequence)
+    current = reference_completion_times(P, sequence)[-1, -1]
+    pos, value, _ = find_best_improving_swap(P, sequence, ct, [3], current)
+    assert pos is None and value == current